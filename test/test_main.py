@@ -1,46 +1,85 @@
 # coding=utf-8
 
+import os
+import socket
 import unittest
+import whois
 from whois import extract_domain
+from whois.parser import PywhoisError
+
+LIVE = os.environ.get("WHOIS_LIVE") == "1"
 
 
 class TestExtractDomain(unittest.TestCase):
-    def test_simple_ascii_domain(self):
-        url = "google.com"
-        domain = url
-        self.assertEqual(domain, extract_domain(url))
-
-    def test_ascii_with_schema_path_and_query(self):
-        url = "https://www.google.com/search?q=why+is+domain+whois+such+a+mess"
-        domain = "google.com"
-        self.assertEqual(domain, extract_domain(url))
-
-    def test_simple_unicode_domain(self):
-        url = "http://нарояци.com/"
-        domain = "нарояци.com"
-        self.assertEqual(domain, extract_domain(url))
-
-    def test_unicode_domain_and_tld(self):
-        url = "http://россия.рф/"
-        domain = "россия.рф"
-        self.assertEqual(domain, extract_domain(url))
-
-    def test_ipv6(self):
-        """Verify that ipv6 addresses work"""
-        url = "2607:f8b0:4006:802::200e"
-        domain = "1e100.net"
-        # double extract_domain() so we avoid possibly changing hostnames like lga34s12-in-x0e.1e100.net
-        self.assertEqual(domain, extract_domain(extract_domain(url)))
-
-    def test_ipv4(self):
-        """Verify that ipv4 addresses work"""
-        url = "172.217.3.110"
-        domain = "1e100.net"
-        # double extract_domain() so we avoid possibly changing hostnames like lga34s18-in-f14.1e100.net
-        self.assertEqual(domain, extract_domain(extract_domain(url)))
-
-    def test_second_level_domain(self):
-        """Verify that TLDs which only have second-level domains parse correctly"""
-        url = "google.co.za"
-        domain = url
-        self.assertEqual(domain, extract_domain(url))
+    CASES = [
+        # simple ascii domain
+        ("google.com", "google.com"),
+        # ascii with schema, path and query
+        (
+            "https://www.google.com/search?q=why+is+domain+whois+such+a+mess",
+            "google.com",
+        ),
+        # only the leading scheme is stripped, not urls in the query
+        ("https://www.google.com/url?q=http://example.org/", "google.com"),
+        # simple unicode domain
+        ("http://нарояци.com/", "нарояци.com"),
+        # unicode domain and tld
+        ("http://россия.рф/", "россия.рф"),
+        # punycode domain and tld
+        ("http://xn--h1alffa9f.xn--p1ai/", "xn--h1alffa9f.xn--p1ai"),
+        # TLDs which only have second-level domains
+        ("google.co.za", "google.co.za"),
+    ]
+
+    IP_CASES = [
+        ("2607:f8b0:4006:802::200e", "1e100.net"),
+        ("172.217.3.110", "1e100.net"),
+    ]
+
+    def test_extract(self):
+        for url, domain in self.CASES:
+            with self.subTest(url=url):
+                self.assertEqual(domain, extract_domain(url))
+
+    @unittest.skipUnless(LIVE, "set WHOIS_LIVE=1 to resolve live addresses")
+    def test_extract_ip(self):
+        """Verify that ipv4 and ipv6 addresses work"""
+        for url, domain in self.IP_CASES:
+            with self.subTest(url=url):
+                # double extract_domain() so we avoid possibly changing hostnames
+                # like lga34s12-in-x0e.1e100.net
+                self.assertEqual(domain, extract_domain(extract_domain(url)))
+
+    def test_extract_ip_cached(self):
+        """Verify that reverse DNS answers are reused"""
+        lookups = []
+
+        def gethostbyaddr(ip):
+            lookups.append(ip)
+            return "host.example.com", [], [ip]
+
+        self.addCleanup(setattr, socket, "gethostbyaddr", socket.gethostbyaddr)
+        self.addCleanup(whois._reverse_dns_cache.clear)
+        socket.gethostbyaddr = gethostbyaddr
+        for _ in range(2):
+            self.assertEqual(extract_domain("192.0.2.1"), "host.example.com")
+        self.assertEqual(lookups, ["192.0.2.1"])
+
+    def test_whois_timeout(self):
+        """Verify that the timeout reaches the builtin client's queries"""
+        timeouts = []
+
+        def query(query, hostname, flags, many_results=False, quiet=False, timeout=10):
+            timeouts.append(timeout)
+            return "Domain: example.de\r\n"
+
+        whois._nic_client.whois = query
+        self.addCleanup(delattr, whois._nic_client, "whois")
+        text = whois.whois("example.de", timeout=5, parse=False)
+        self.assertEqual(text, "Domain: example.de\r\n")
+        self.assertEqual(timeouts, [5])
+
+    def test_whois_command_timeout(self):
+        """Verify that a native command running too long raises PywhoisError"""
+        with self.assertRaises(PywhoisError):
+            whois.whois("5", command=True, executable="sleep", timeout=0.1)
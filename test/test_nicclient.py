@@ -1,15 +1,146 @@
 # coding=utf-8
 
+import asyncio
+import json
+import os
+import tempfile
+import time
 import unittest
+from unittest import mock
 from whois.whois import NICClient
 
+LIVE = os.environ.get("WHOIS_LIVE") == "1"
+
 
 class TestNICClient(unittest.TestCase):
     def setUp(self):
         self.client = NICClient()
 
+    def isolate_server_cache(self):
+        """Use an empty, memory only server cache for the current test"""
+        saved = (
+            NICClient.SERVER_CACHE_PATH,
+            NICClient._server_cache,
+            NICClient._server_cache_dirty,
+        )
+
+        def restore():
+            (
+                NICClient.SERVER_CACHE_PATH,
+                NICClient._server_cache,
+                NICClient._server_cache_dirty,
+            ) = saved
+
+        self.addCleanup(restore)
+        NICClient.SERVER_CACHE_PATH = None
+        NICClient._server_cache = None
+
+    @unittest.skipUnless(LIVE, "set WHOIS_LIVE=1 to query live whois servers")
     def test_choose_server(self):
         domain = "рнидс.срб"
         chosen = self.client.choose_server(domain)
         correct = "whois.rnids.rs"
         self.assertEqual(chosen, correct)
+
+    def test_choose_server_caches_iana_lookup(self):
+        lookups = []
+
+        def findwhois_iana(tld):
+            lookups.append(tld)
+            return "whois.nic.example"
+
+        self.client.findwhois_iana = findwhois_iana
+        self.isolate_server_cache()
+        for _ in range(2):
+            chosen = self.client.choose_server("domain.example")
+            self.assertEqual(chosen, "whois.nic.example")
+        self.assertEqual(lookups, ["example"])
+
+    def test_choose_servers(self):
+        domains = ["google.de", "россия.рф", "example.pp.ua", "google.de"]
+        chosen = self.client.choose_servers(domains)
+        correct = {
+            "google.de": "whois.denic.de",
+            "россия.рф": "whois.registry.tcinet.ru",
+            "example.pp.ua": "whois.pp.ua",
+        }
+        self.assertEqual(chosen, correct)
+
+    def test_choose_server_async(self):
+        async def findwhois_iana_async(tld):
+            return "whois.nic." + tld
+
+        self.client.findwhois_iana_async = findwhois_iana_async
+        self.isolate_server_cache()
+        domains = ["google.de", "domain.example", "domain.test"]
+        chosen = asyncio.run(self._gather(domains))
+        correct = ["whois.denic.de", "whois.nic.example", "whois.nic.test"]
+        self.assertEqual(chosen, correct)
+
+    def test_findwhois_iana_async_socks(self):
+        # connections through a SOCKS proxy are made by the sync lookup
+        self.client.findwhois_iana = lambda tld: "whois.nic." + tld
+        with mock.patch.dict(os.environ, {"SOCKS": "localhost:1080"}):
+            server = asyncio.run(self.client.findwhois_iana_async("example"))
+        self.assertEqual(server, "whois.nic.example")
+
+    async def _gather(self, domains):
+        return await asyncio.gather(
+            *(self.client.choose_server_async(domain) for domain in domains)
+        )
+
+    def test_whois_lookup_caches_no_match(self):
+        queries = []
+
+        def whois(query, hostname, flags, quiet=False, timeout=10):
+            queries.append(query)
+            return 'No match for "{}".\r\n'.format(query.upper())
+
+        self.client.whois = whois
+        self.addCleanup(NICClient.clear_negative_cache)
+        for _ in range(2):
+            result = self.client.whois_lookup(None, "unregistered.de", 0)
+            self.assertTrue(result.startswith("No match for"))
+        self.assertEqual(queries, ["unregistered.de"])
+
+    def test_negative_cache_is_bounded(self):
+        self.addCleanup(NICClient.clear_negative_cache)
+        self.addCleanup(setattr, NICClient, "NEGATIVE_CACHE_SIZE", 4096)
+        NICClient.NEGATIVE_CACHE_SIZE = 2
+        for query in ["a.de", "b.de", "c.de"]:
+            NICClient.set_negative_result(query, "No match for {}".format(query))
+        self.assertIsNone(NICClient.get_negative_result("a.de"))
+        self.assertIsNotNone(NICClient.get_negative_result("c.de"))
+        self.assertEqual(len(NICClient._negative_cache), 2)
+
+    def test_server_cache_file(self):
+        self.isolate_server_cache()
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        NICClient.SERVER_CACHE_PATH = os.path.join(cache_dir.name, "servers.json")
+        NICClient.set_cached_server("example", "whois.nic.example")
+        NICClient._save_server_cache()
+        self.assertEqual(os.listdir(cache_dir.name), ["servers.json"])
+
+        # entries without a server, e.g. edited by hand, are ignored
+        with open(NICClient.SERVER_CACHE_PATH, "w", encoding="utf-8") as cache_fp:
+            json.dump({"example": {"ts": time.time()}}, cache_fp)
+        NICClient._server_cache = None
+        self.assertIsNone(NICClient.get_cached_server("example"))
+
+    def test_server_cache_file_wrong_shape(self):
+        self.isolate_server_cache()
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        NICClient.SERVER_CACHE_PATH = os.path.join(cache_dir.name, "servers.json")
+        saved_files = [
+            ["example", "whois.nic.example"],
+            {"example": {"server": "whois.nic.example", "ts": "1"}},
+        ]
+        cache_path = NICClient.SERVER_CACHE_PATH
+        for saved in saved_files:
+            with self.subTest(saved=saved):
+                with open(cache_path, "w", encoding="utf-8") as cache_fp:
+                    json.dump(saved, cache_fp)
+                NICClient._server_cache = None
+                self.assertIsNone(NICClient.get_cached_server("example"))
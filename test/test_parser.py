@@ -3,16 +3,77 @@
 import os
 import datetime
 import json
-from glob import glob
+import re
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from dateutil.parser import isoparse
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 from whois.parser import (
+    PywhoisError,
     WhoisEntry,
     cast_date,
+    datetime_parse,
     WhoisCa,
 )
 
+SAMPLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "samples")
+MISSING = object()
+
+
+def _expected_date(value):
+    """Turn a date written to an expected results file with str() back into
+    the datetime it came from. Strings that str() of a datetime would not
+    produce were never dates and are returned unchanged.
+    """
+    if isinstance(value, list):
+        return [_expected_date(element) for element in value]
+    if isinstance(value, str):
+        try:
+            date = isoparse(value)
+        except ValueError:
+            return value
+        if str(date) == value:
+            return date
+    return value
+
+
+def _parse_sample(sample, keys):
+    """Parse one (domain, data) sample and return the values of ``keys``.
+    This lives at module level so that it can be sent to a worker process.
+    """
+    domain, data = sample
+    w = WhoisEntry.load(domain, data)
+    return {key: w.get(key) for key in keys}
+
 
 class TestParser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Read all the samples and expected results once, so that
+        # test_com_allsamples only parses and compares
+        cls.samples = []
+        with os.scandir(os.path.join(SAMPLES_PATH, "whois")) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith("."):
+                    with open(entry.path, "rb") as whois_fp:
+                        cls.samples.append((entry.name, whois_fp.read()))
+        cls.samples.sort()  # report mismatches in a stable order
+        with os.scandir(os.path.join(SAMPLES_PATH, "expected")) as entries:
+            expected_files = {entry.name: entry.path for entry in entries}
+        cls.expected = {}
+        for domain, _ in cls.samples:
+            with open(expected_files[domain], "rb") as infil:
+                expected_results = json_loads(infil.read())
+            for key in ("creation_date", "updated_date", "expiration_date"):
+                if key in expected_results:
+                    expected_results[key] = _expected_date(expected_results[key])
+            cls.expected[domain] = expected_results
+
     def test_com_expiration(self):
         data = """
         Status: ok
@@ -23,14 +84,84 @@ class TestParser(unittest.TestCase):
         >>> Last update of whois database: Sun, 31 Aug 2008 00:18:23 UTC <<<
         """
         w = WhoisEntry.load("urlowl.com", data)
-        expires = w.expiration_date.strftime("%Y-%m-%d")
+        expires = w.expiration_date.date().isoformat()
         self.assertEqual(expires, "2018-02-21")
 
     def test_cast_date(self):
-        dates = ["14-apr-2008", "2008-04-14"]
+        dates = [
+            "14-apr-2008",
+            "14-April-2008",
+            "20080414",
+            "2008-04-14",
+            "2008/04/14",
+            "2008-04-14T00:00:00Z",
+            "2008-04-14 00:00:00",
+            "2008-04-14T00:00:00.000Z",
+        ]
+        for d in dates:
+            with self.subTest(date=d):
+                r = cast_date(d).date().isoformat()
+                self.assertEqual(r, "2008-04-14")
+
+    def test_datetime_parse(self):
+        dates = [
+            "14.04.2008",
+            "2008. 04. 14.",
+            "14-Apr-2008 00:00:00 UTC",
+            "Mon Apr 14 2008",
+            "2008-04-14t00:00:00.000z",
+            "before 2008-04-14",
+            "2008-04-14 00:00:00 (GMT+00:00)",
+            "2008-Apr-14.",
+        ]
         for d in dates:
-            r = cast_date(d).strftime("%Y-%m-%d")
-            self.assertEqual(r, "2008-04-14")
+            with self.subTest(date=d):
+                r = datetime_parse(d).date().isoformat()
+                self.assertEqual(r, "2008-04-14")
+
+    def test_not_found(self):
+        cases = [
+            ("unregistered.com", 'No match for "UNREGISTERED.COM".\r\n'),
+            ("unregistered.jp", "No match!!\r\n"),
+        ]
+        for domain, text in cases:
+            with self.subTest(domain=domain):
+                with self.assertRaises(PywhoisError):
+                    WhoisEntry.load(domain, text)
+
+    def test_load_cache(self):
+        data = """
+        Domain Name: example.com
+        Name Server: a.example.com
+        Name Server: b.example.com
+        """
+        w = WhoisEntry.load("example.com", data)
+        w.name_servers.append("c.example.com")
+        w["registrar"] = "Changed"
+        w2 = WhoisEntry.load("example.com", data)
+        self.assertIsNot(w, w2)
+        self.assertEqual(w2.name_servers, ["a.example.com", "b.example.com"])
+        self.assertIsNone(w2.registrar)
+        self.assertEqual(w2.domain, "example.com")
+
+    def test_simple_key_lines(self):
+        """Line index lookups must agree with re.findall"""
+        data = """
+        Sponsoring Registrar: Example Registrar
+        Registrar:
+        Registrar:    Other Registrar
+        Registrar URL: http://registrar.example
+        Notice: see Status: for details
+        Status: ok
+        """
+        patterns = ["Registrar: *(.+)", "Registrar URL:(.+)", "Status: *(.+)"]
+        lines = WhoisEntry._index_lines(data, patterns)
+        for pattern in patterns[:2]:
+            with self.subTest(pattern=pattern):
+                expected = re.findall(pattern, data, re.IGNORECASE | re.M)
+                self.assertEqual(WhoisEntry._find_in_lines(lines, pattern), expected)
+        # "Status:" also follows another colon, so the regex has to be used
+        self.assertIsNone(WhoisEntry._find_in_lines(lines, "Status: *(.+)"))
 
     def test_com_allsamples(self):
         """
@@ -50,20 +181,24 @@ class TestParser(unittest.TestCase):
             "status",
         ]
         total = 0
-        whois_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "samples", "whois", "*"
-        )
-        expect_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "samples", "expected"
-        )
-        for path in glob(whois_path):
-            # Parse whois data
-            domain = os.path.basename(path)
-            with open(path) as whois_fp:
-                data = whois_fp.read()
-
-            w = WhoisEntry.load(domain, data)
-            results = {key: w.get(key) for key in keys_to_test}
+        diffs = []
+        expect_path = os.path.join(SAMPLES_PATH, "expected")
+        samples = self.samples
+
+        # Parse whois data, spread over all cores when it is worth the
+        # cost of starting the worker processes
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(samples) >= 16:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(
+                    executor.map(
+                        _parse_sample, samples, repeat(keys_to_test), chunksize=8
+                    )
+                )
+        else:
+            parsed = list(map(_parse_sample, samples, repeat(keys_to_test)))
+
+        for (domain, data), results in zip(samples, parsed):
 
             # NOTE: Toggle condition below to write expected results from the
             # parse results This will overwrite the existing expected results.
@@ -81,25 +216,25 @@ class TestParser(unittest.TestCase):
                     expected_results = json.dump(results, outfil, default=date2str4json)
                 continue
 
-            # Load expected result
-            with open(os.path.join(expect_path, domain)) as infil:
-                expected_results = json.load(infil)
+            expected_results = self.expected[domain]
 
             # Compare each key
-            compare_keys = set.union(set(results), set(expected_results))
-            if keys_to_test is not None:
-                compare_keys = compare_keys.intersection(set(keys_to_test))
-            for key in compare_keys:
+            for key in keys_to_test:
                 total += 1
-                self.assertIn(key, results)
+                result = results.get(key, MISSING)
+                if result is MISSING:
+                    diffs.append("{}\t({}):\tmissing in results".format(domain, key))
+                    continue
 
-                result = results.get(key)
-                if isinstance(result, list):
-                    result = [str(element) for element in result]
-                if isinstance(result, datetime.datetime):
-                    result = str(result)
                 expected = expected_results.get(key)
-                self.assertEqual(expected, result)
+                if expected != result:
+                    diffs.append(
+                        "{}\t({}):\t{!r} != {!r}".format(domain, key, result, expected)
+                    )
+
+        if diffs:
+            diffs.append("{}/{} failed".format(len(diffs), total))
+            self.fail("\n".join(diffs))
 
     def test_ca_parse(self):
         data = """
@@ -528,7 +663,7 @@ DNSSEC: signedDelegation
         """
 
         w = WhoisEntry.load("randomtest.nl", data)
-        expires = w.expiration_date.strftime("%Y-%m-%d")
+        expires = w.expiration_date.date().isoformat()
         self.assertEqual(expires, "2020-12-06")
 
     def test_dk_parse(self):
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 
-import re
+import functools
+import ipaddress
 import sys
-import os
 import subprocess
 import socket
-from .parser import WhoisEntry
+import threading
+import time
+from importlib import resources
+from .parser import WhoisEntry, PywhoisError
 from .whois import NICClient
 import logging
 
@@ -17,48 +20,164 @@ formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(messag
 handler.setFormatter(formatter)
 logger.addHandler(handler)
 
-# thanks to https://www.regextester.com/104038
-IPV4_OR_V6 = re.compile(
-    r"((^\s*((([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))\s*$)|(^\s*((([0-9A-Fa-f]{1,4}:){7}([0-9A-Fa-f]{1,4}|:))|(([0-9A-Fa-f]{1,4}:){6}(:[0-9A-Fa-f]{1,4}|((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){5}(((:[0-9A-Fa-f]{1,4}){1,2})|:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){4}(((:[0-9A-Fa-f]{1,4}){1,3})|((:[0-9A-Fa-f]{1,4})?:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){3}(((:[0-9A-Fa-f]{1,4}){1,4})|((:[0-9A-Fa-f]{1,4}){0,2}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){2}(((:[0-9A-Fa-f]{1,4}){1,5})|((:[0-9A-Fa-f]{1,4}){0,3}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){1}(((:[0-9A-Fa-f]{1,4}){1,6})|((:[0-9A-Fa-f]{1,4}){0,4}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(:(((:[0-9A-Fa-f]{1,4}){1,7})|((:[0-9A-Fa-f]{1,4}){0,5}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:)))(%.+)?\s*$))"  # noqa: E501
-)
 
-
-def whois(url, command=False, flags=0, executable="whois", inc_raw=False, quiet=False, convert_punycode=True):
+def _is_ip(url):
+    """Check whether ``url`` is an IPv4 or IPv6 address"""
+    url = url.strip()
+    # domain names rarely start with a digit, so skip the exception for them
+    if not url[:1].isdigit() and ":" not in url:
+        return False
+    try:
+        ipaddress.ip_address(url)
+    except ValueError:
+        return False
+    return True
+
+
+# reverse DNS answers are remembered for REVERSE_DNS_TTL seconds
+REVERSE_DNS_TTL = 5 * 60
+REVERSE_DNS_CACHE_SIZE = 1024
+_reverse_dns_cache = {}
+_reverse_dns_lock = threading.Lock()
+
+
+def _reverse_dns(ip):
+    """Return the hostname of ``ip``, reusing a recent answer if there is one"""
+    now = time.time()
+    with _reverse_dns_lock:
+        entry = _reverse_dns_cache.get(ip)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    # resolve outside the lock, so one slow lookup does not block the others
+    hostname = socket.gethostbyaddr(ip)[0]
+    with _reverse_dns_lock:
+        _reverse_dns_cache.pop(ip, None)
+        while _reverse_dns_cache and len(_reverse_dns_cache) >= REVERSE_DNS_CACHE_SIZE:
+            # drop the oldest answer
+            del _reverse_dns_cache[next(iter(_reverse_dns_cache))]
+        _reverse_dns_cache[ip] = (now + REVERSE_DNS_TTL, hostname)
+    return hostname
+
+
+# whois servers close the connection after each answer (RFC 3912), so there
+# are no sockets to pool, but one client is shared between whois() calls
+_nic_client = NICClient()
+
+
+def whois(url, command=False, flags=0, executable="whois", inc_raw=False, quiet=False, convert_punycode=True,
+          timeout=10, parse=True):
+    """Look up ``url`` and return its parsed WhoisEntry, or with ``parse=False``
+    the raw response text.
+
+    ``timeout`` is in seconds: how long the native whois command may run with
+    ``command=True``, raising PywhoisError when it takes longer, otherwise the
+    socket timeout of each query made by the builtin client.
+    """
     # clean domain to expose netloc
-    ip_match = IPV4_OR_V6.match(url)
-    if ip_match:
+    if _is_ip(url):
         domain = url
         try:
-            result = socket.gethostbyaddr(url)
+            hostname = _reverse_dns(url)
         except socket.herror:
             pass
         else:
-            domain = extract_domain(result[0])
+            domain = extract_domain(hostname)
     else:
         domain = extract_domain(url)
     if command:
-        # try native whois command
-        r = subprocess.Popen([executable, domain], stdout=subprocess.PIPE)
-        text = r.stdout.read().decode()
+        # try native whois command, waiting at most timeout seconds for it
+        try:
+            r = subprocess.run([executable, domain], stdout=subprocess.PIPE, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            raise PywhoisError("%s did not finish within %s seconds" % (executable, timeout))
+        text = r.stdout.decode("utf-8", "replace")
     else:
-        # try builtin client
-        nic_client = NICClient()
-        if convert_punycode:
-            text = nic_client.whois_lookup(None, domain.encode("idna"), flags, quiet=quiet)
-        else:
-            text = nic_client.whois_lookup(None, domain, flags, quiet=quiet)
+        # try builtin client, only ascii encoding internationalized domains
+        query = domain
+        if convert_punycode and not domain.isascii():
+            query = domain.encode("idna")
+        text = _nic_client.whois_lookup(None, query, flags, quiet=quiet, timeout=timeout)
+    if not parse:
+        # the caller only wants the server response
+        return text
     entry = WhoisEntry.load(domain, text)
     if inc_raw:
         entry["raw"] = text
     return entry
 
 
-suffixes = None
+# flags kept under the None key of each public suffix trie node
+_PSL_RULE, _PSL_WILDCARD, _PSL_EXCEPTION = 1, 2, 4
+_PSL_EMPTY = {}
+
+
+def _load_suffixes():
+    """Parse the bundled Public Suffix List into a trie keyed by reversed
+    labels, so that "*.kawasaki.jp" flags the node at jp -> kawasaki.
+    """
+    trie = {}
+    # downloaded from https://publicsuffix.org/list/public_suffix_list.dat
+    tlds_path = resources.files(__name__) / "data" / "public_suffix_list.dat"
+    with tlds_path.open(encoding="utf-8") as tlds_fp:
+        for line in tlds_fp:
+            line = line.rstrip()
+            # skip blank lines and "//" comments
+            if not line or line[0] == "/":
+                continue
+            if line.startswith("*."):
+                line, flag = line[2:], _PSL_WILDCARD
+            elif line.startswith("!"):
+                line, flag = line[1:], _PSL_EXCEPTION
+            else:
+                flag = _PSL_RULE
+            rules = [line]
+            if not line.isascii():
+                # also match names that are already punycode encoded
+                rules.append(line.encode("idna").decode("ascii"))
+            for rule in rules:
+                node = trie
+                for label in reversed(rule.split(".")):
+                    # labels such as "city" or "gov" repeat under many parents
+                    node = node.setdefault(sys.intern(label), {})
+                node[None] = node.get(None, 0) | flag
+    return trie
+
+
+# known TLD suffixes, parsed on the first call to extract_domain()
+_psl_trie = None
+_psl_lock = threading.Lock()
+
+
+def _suffix_trie():
+    """Return the public suffix trie, loading it once across threads"""
+    global _psl_trie
+    if _psl_trie is None:
+        with _psl_lock:
+            if _psl_trie is None:
+                _psl_trie = _load_suffixes()
+    return _psl_trie
+
+
+def _match_suffix(node, label):
+    """Step from the trie ``node`` down to ``label``, returning the child node
+    and whether the labels walked so far form a public suffix
+    """
+    child = node.get(label, _PSL_EMPTY)
+    flags = child.get(None, 0)
+    if flags & _PSL_RULE:
+        return child, True
+    return child, bool(
+        node.get(None, 0) & _PSL_WILDCARD and not flags & _PSL_EXCEPTION
+    )
 
 
 def extract_domain(url):
     """Extract the domain from the given URL
 
+    IP addresses are resolved with reverse DNS instead, so 172.217.3.110
+    gives a host under 1e100.net. Those examples need the network and are
+    covered by the live tests rather than doctests.
+
     >>> logger.info(extract_domain('http://www.google.com.au/tos.html'))
     google.com.au
     >>> logger.info(extract_domain('abc.def.com'))
@@ -69,60 +188,52 @@ def extract_domain(url):
     chambagri.fr
     >>> logger.info(extract_domain('www.webscraping.com'))
     webscraping.com
-    >>> logger.info(extract_domain('198.252.206.140'))
-    stackoverflow.com
     >>> logger.info(extract_domain('102.112.2O7.net'))
     2o7.net
     >>> logger.info(extract_domain('globoesporte.globo.com'))
     globo.com
     >>> logger.info(extract_domain('1-0-1-1-1-0-1-1-1-1-1-1-1-.0-0-0-0-0-0-0-0-0-0-0-0-0-10-0-0-0-0-0-0-0-0-0-0-0-0-0.info'))
     0-0-0-0-0-0-0-0-0-0-0-0-0-10-0-0-0-0-0-0-0-0-0-0-0-0-0.info
-    >>> logger.info(extract_domain('2607:f8b0:4006:802::200e'))
-    1e100.net
-    >>> logger.info(extract_domain('172.217.3.110'))
-    1e100.net
     """
-    if IPV4_OR_V6.match(url):
-        # this is an IP address
-        return socket.gethostbyaddr(url)[0]
-
-    # load known TLD suffixes
-    global suffixes
-    if not suffixes:
-        # downloaded from https://publicsuffix.org/list/public_suffix_list.dat
-        tlds_path = os.path.join(
-            os.getcwd(), os.path.dirname(__file__), "data", "public_suffix_list.dat"
-        )
-        with open(tlds_path, encoding="utf-8") as tlds_fp:
-            suffixes = set(
-                line.encode("utf-8")
-                for line in tlds_fp.read().splitlines()
-                if line and not line.startswith("//")
-            )
-
     if not isinstance(url, str):
         url = url.decode("utf-8")
-    url = re.sub("^.*://", "", url)
-    url = url.split("/")[0].lower()
+    if _is_ip(url):
+        # this is an IP address
+        return _reverse_dns(url)
+    return _extract_domain_cached(url)
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_domain_cached(url):
+    """Extract the domain from a URL that is not an IP address"""
+    scheme_end = url.find("://")
+    if scheme_end != -1:
+        url = url[scheme_end + 3:]
+    path_start = url.find("/")
+    if path_start != -1:
+        url = url[:path_start]
+    url = url.lower()
 
     # find the longest suffix match
-    domain = b""
     split_url = url.split(".")
+    node = _suffix_trie()
+    depth = 0
     for section in reversed(split_url):
-        if domain:
-            domain = b"." + domain
-        domain = section.encode("utf-8") + domain
-        if domain not in suffixes:
-            if b"." not in domain and len(split_url) >= 2:
+        node, is_suffix = _match_suffix(node, section)
+        depth += 1
+        if not is_suffix:
+            if depth == 1 and len(split_url) >= 2:
                 # If this is the first section and there wasn't a match, try to
                 # match the first two sections - if that works, keep going
                 # See https://github.com/richardpenman/whois/issues/50
-                second_order_tld = ".".join([split_url[-2], split_url[-1]])
-                if not second_order_tld.encode("utf-8") in suffixes:
-                    break
-            else:
-                break
-    return domain.decode("utf-8")
+                if _match_suffix(node, split_url[-2])[1]:
+                    continue
+            break
+    return ".".join(split_url[-depth:])
+
+
+# reverse DNS answers expire on their own, so this only clears domain lookups
+extract_domain.cache_clear = _extract_domain_cached.cache_clear
 
 
 if __name__ == "__main__":
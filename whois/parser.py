@@ -7,7 +7,10 @@
 # the MIT license: http://www.opensource.org/licenses/mit-license.php
 
 import re
+import sys
+import threading
 from datetime import datetime
+from functools import lru_cache
 import json
 import dateutil.parser as dp
 from dateutil.utils import default_tzinfo
@@ -18,6 +21,12 @@ EMAIL_REGEX = (
     r"a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?"
 )
 
+# Patterns whose matches never span lines and always contain the given
+# literal, so only the lines containing it have to be searched
+LINE_LITERALS = {
+    EMAIL_REGEX: "@",
+}
+
 KNOWN_FORMATS = [
     "%d-%b-%Y",  # 02-jan-2000
     "%d-%B-%Y",  # 11-February-2000
@@ -63,15 +72,124 @@ KNOWN_FORMATS = [
     "before %Y%m%d",  # before 19960821
     "%Y-%m-%d %H:%M:%S (%Z%z)",  # 2017-09-26 11:38:29 (GMT+00:00)
     "%Y-%b-%d.",  # 2024-Apr-02.
+    "%Y-%m-%d %H:%M:%S.%f",  # 2018-05-19 12:18:44.329522
 ]
 
+# The most common formats, tried before anything else. No earlier entry of
+# KNOWN_FORMATS can parse a string that one of these parses to a different
+# date, and no two of them do either, so trying them first in any order
+# does not change the result.
+FAST_FORMATS = [
+    "%Y-%m-%dT%H:%M:%SZ",  # 2007-01-26T19:10:31Z
+    "%Y-%m-%d",  # 2000-01-02
+    "%Y/%m/%d",  # 2000/01/02
+    "%d-%b-%Y",  # 02-jan-2000
+    "%d-%B-%Y",  # 11-February-2000
+    "%Y%m%d",  # 20170209
+    "%Y-%m-%d %H:%M:%S",  # 2000-08-22 18:55:20
+    "%Y-%m-%dT%H:%M:%S.%fZ",  # 2018-12-01T16:17:30.568Z
+]
+
+# per thread copy of FAST_FORMATS with the last successful format first
+_fast_formats = threading.local()
+
+
+REGEX_FLAGS = re.IGNORECASE | re.M
+
 
 class PywhoisError(Exception):
     pass
 
 
+# a pattern that just captures the rest of the line after a literal "Key:"
+SIMPLE_KEY_REGEX = re.compile(r"([A-Za-z][\w '/-]*):( \*)?\(\.\+\)")
+LITERAL_PREFIX_REGEX = re.compile(r"[A-Za-z0-9 :_-]+")
+
+
+@lru_cache(maxsize=None)
+def simple_key(pattern):
+    """Return ``(key, strip_spaces)`` if ``pattern`` is of the form
+    ``Key: *(.+)`` or ``Key:(.+)``, otherwise None
+    """
+    match = SIMPLE_KEY_REGEX.fullmatch(pattern)
+    if match:
+        return match.group(1).lower(), bool(match.group(2))
+    return None
+
+
+@lru_cache(maxsize=None)
+def required_literal(pattern):
+    """Return the lowercased literal text every match of ``pattern`` starts
+    with, e.g. ``registry expiry date:`` for ``Registry Expiry Date: *(.+)``,
+    or None if there is no usable one. Patterns with an alternation anywhere
+    are left alone, as the literal might belong to just one branch.
+    """
+    if "|" in pattern:
+        return None
+    match = LITERAL_PREFIX_REGEX.match(pattern)
+    if not match:
+        return None
+    literal = match.group()
+    if pattern[match.end():match.end() + 1] in ("*", "?", "+", "{"):
+        literal = literal[:-1]  # the quantifier applies to the last character
+    if len(literal) < 3:
+        return None
+    return literal.lower()
+
+
+@lru_cache(maxsize=None)
+def key_trie(keys):
+    """Build a trie of the reversed ``keys``. Walking it backwards from the end
+    of a line key reaches a node holding ``""`` for every key the line key
+    ends with.
+    """
+    root = {}
+    for key in keys:
+        node = root
+        for char in reversed(key):
+            node = node.setdefault(char, {})
+        node[""] = key
+    return root
+
+
+@lru_cache(maxsize=None)
+def compile_regex(pattern):
+    """Compile a field pattern the first time a parser needs it, rather than
+    compiling the patterns of every parser class on import.
+    """
+    return re.compile(pattern, REGEX_FLAGS)
+
+
+def format_literals(known_format):
+    """Return the characters a string must contain to match ``known_format``.
+    Whitespace is left out, as strptime matches it against any whitespace.
+    """
+    return frozenset(re.sub(r"%.", "", known_format).lower()) - frozenset(" ")
+
+
+KNOWN_FORMAT_LITERALS = [
+    (known_format, format_literals(known_format)) for known_format in KNOWN_FORMATS
+]
+LITERAL_CHARS = frozenset().union(*(literals for _, literals in KNOWN_FORMAT_LITERALS))
+
+
+@lru_cache(maxsize=None)
+def candidate_formats(chars):
+    """Return the KNOWN_FORMATS, in order, whose literals are all in ``chars``"""
+    return [
+        known_format
+        for known_format, literals in KNOWN_FORMAT_LITERALS
+        if literals <= chars
+    ]
+
+
 def datetime_parse(s):
-    for known_format in KNOWN_FORMATS:
+    formats = KNOWN_FORMATS
+    if s.isascii():
+        # skip the formats with a separator or word that s does not contain,
+        # as strptime would reject them anyway
+        formats = candidate_formats(frozenset(s.lower()) & LITERAL_CHARS)
+    for known_format in formats:
         try:
             s = datetime.strptime(s, known_format)
             break
@@ -80,8 +198,28 @@ def datetime_parse(s):
     return s
 
 
+@lru_cache(maxsize=4096)
 def cast_date(s, dayfirst=False, yearfirst=False):
-    """Convert any date string found in WHOIS to a datetime object."""
+    """Convert any date string found in WHOIS to a datetime object.
+    Results are cached, as the same dates recur across many records.
+    """
+    formats = getattr(_fast_formats, "order", None)
+    if formats is None:
+        formats = _fast_formats.order = list(FAST_FORMATS)
+    if not (s[:1].isdigit() or s[:1] == " "):
+        # every FAST_FORMATS date starts with %Y or %d, so a digit or the
+        # space of a padded day; skip failing each of them in turn
+        formats = ()
+    for known_format in formats:
+        try:
+            value = datetime.strptime(s, known_format)
+        except ValueError:
+            continue  # Wrong format, keep trying
+        if formats[0] != known_format:
+            # the next date is likely to be in the same format
+            formats.remove(known_format)
+            formats.insert(0, known_format)
+        return value
     try:
         # Use datetime.timezone.utc to support < Python3.9
         return default_tzinfo(dp.parse(
@@ -91,6 +229,12 @@ def cast_date(s, dayfirst=False, yearfirst=False):
         return datetime_parse(s)
 
 
+# low cardinality fields whose string values are shared between entries
+INTERNED_FIELDS = frozenset(
+    {"status", "registrar", "country", "dnssec", "name_servers"}
+)
+
+
 class WhoisEntry(dict):
     """Base class for parsing a Whois entries."""
 
@@ -120,16 +264,23 @@ class WhoisEntry(dict):
     }
     dayfirst = False
     yearfirst = False
+    # child classes set regex to replace _regex with their own patterns
+    regex = None
+    # text found in the response when the domain is not registered
+    not_found = ()
 
     def __init__(self, domain, text, regex=None):
         if (
             "This TLD has no whois server, but you can access the whois database at"
             in text
+            or any(marker in text for marker in self.not_found)
         ):
             raise PywhoisError(text)
         else:
             self.domain = domain
             self.text = text
+            if regex is None:
+                regex = self.regex
             if regex is not None:
                 self._regex = regex
             self.parse()
@@ -138,30 +289,105 @@ class WhoisEntry(dict):
         """The first time an attribute is called it will be calculated here.
         The attribute is then set to be accessed directly by subsequent calls.
         """
-        for attr, regex in list(self._regex.items()):
-            if regex:
-                values = []
-                for data in re.findall(regex, self.text, re.IGNORECASE | re.M):
-                    matches = data if isinstance(data, tuple) else [data]
-                    for value in matches:
-                        value = self._preprocess(attr, value)
-                        if value and str(value).lower() not in [str(v).lower() for v in values]:
-                            # avoid duplicates
-                            values.append(value)
-                if values and attr in ("registrar", "whois_server", "referral_url"):
-                    values = values[-1]  # ignore junk
-                if len(values) == 1:
-                    values = values[0]
-                elif not values:
-                    values = None
-
-                self[attr] = values
+        regexes = {attr: regex for attr, regex in self._regex.items() if regex}
+        lines = self._index_lines(self.text, list(regexes.values()))
+        # only for ASCII text, where lowercasing agrees with re.IGNORECASE
+        lowered = self.text.lower() if lines is not None else None
+        for attr, regex in regexes.items():
+            found = None
+            if lines is not None:
+                found = self._find_in_lines(lines, regex)
+                if found is None:
+                    literal = required_literal(regex)
+                    if literal and literal not in lowered:
+                        found = []  # the regex cannot match
+            if found is None:
+                line_literal = LINE_LITERALS.get(regex)
+                if line_literal:
+                    found = [
+                        match
+                        for line in self.text.split("\n")
+                        if line_literal in line
+                        for match in compile_regex(regex).findall(line)
+                    ]
+                else:
+                    found = compile_regex(regex).findall(self.text)
+            values = []
+            for data in found:
+                matches = data if isinstance(data, tuple) else [data]
+                for value in matches:
+                    value = self._preprocess(attr, value)
+                    if value and str(value).lower() not in [str(v).lower() for v in values]:
+                        # avoid duplicates
+                        values.append(value)
+            if values and attr in ("registrar", "whois_server", "referral_url"):
+                values = values[-1]  # ignore junk
+            if len(values) == 1:
+                values = values[0]
+            elif not values:
+                values = None
+
+            self[attr] = values
+
+    @staticmethod
+    def _index_lines(text, patterns):
+        """Split ``text`` once into ``Key: value`` lines, so that patterns of
+        the form ``Key: *(.+)`` can be answered without scanning the whole
+        text again. Each line key is routed to every key in ``patterns`` that
+        it ends with, in a single walk of ``key_trie``. Returns ``(hits,
+        rest)`` where ``hits`` maps each pattern key to its values and
+        ``rest`` holds everything after the first colon of each line.
+        Non-ASCII text returns None, because lowercasing it may not agree
+        with ``re.IGNORECASE``.
+        """
+        if not text.isascii():
+            return None
+        keys = (simple_key(pattern) for pattern in patterns)
+        trie = key_trie(frozenset(key[0] for key in keys if key))
+        hits = {}
+        rest = []
+        for line in text.split("\n"):
+            key, colon, value = line.partition(":")
+            if colon:
+                rest.append(value.lower())
+                node = trie
+                for char in reversed(key.lower()):
+                    node = node.get(char)
+                    if node is None:
+                        break
+                    if "" in node:
+                        hits.setdefault(node[""], []).append(value)
+        return hits, "\n".join(rest)
+
+    @staticmethod
+    def _find_in_lines(lines, pattern):
+        """Return what ``re.findall`` would for a ``Key: *(.+)`` pattern using
+        the hits collected by ``_index_lines``, or None if it cannot tell.
+        """
+        key = simple_key(pattern)
+        if key is None:
+            return None
+        key, strip_spaces = key
+        hits, rest = lines
+        if key + ":" in rest:
+            return None  # the key also appears after another colon
+        values = []
+        for value in hits.get(key, ()):
+            if value:
+                if strip_spaces:
+                    value = value.lstrip(" ") or " "
+                values.append(value)
+        return values
 
     def _preprocess(self, attr, value):
         value = value.strip()
         if value and isinstance(value, str) and not value.isdigit() and "_date" in attr:
             # try casting to date format
             value = cast_date(value, dayfirst=self.dayfirst, yearfirst=self.yearfirst)
+        if attr in INTERNED_FIELDS and isinstance(value, str) and len(value) < 128:
+            # these values repeat across many entries; the others are mostly
+            # unique, and interned strings are never freed on Python 3.12
+            value = sys.intern(value)
         return value
 
     def __setitem__(self, name, value):
@@ -185,213 +411,35 @@ class WhoisEntry(dict):
     @staticmethod
     def load(domain, text):
         """Given whois output in ``text``, return an instance of ``WhoisEntry``
-        that represents its parsed contents.
+        that represents its parsed contents. ``text`` may also be the raw
+        bytes of the response, which are decoded as UTF-8.
+
+        Recent results are cached, so loading the same response again only
+        costs a copy of the cached entry.
         """
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", "replace")
+        cached = WhoisEntry._load(domain, text)
+        # copy, so that callers changing their entry do not change the cache
+        entry = dict.__new__(type(cached))
+        entry.__dict__.update(cached.__dict__)
+        for key, value in cached.items():
+            if isinstance(value, list):
+                value = list(value)
+            dict.__setitem__(entry, key, value)
+        return entry
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _load(domain, text):
         if text.strip() == "No whois server is known for this kind of object.":
             raise PywhoisError(text)
 
-        if domain.endswith(".com"):
-            return WhoisCom(domain, text)
-        elif domain.endswith(".net"):
-            return WhoisNet(domain, text)
-        elif domain.endswith(".org"):
-            return WhoisOrg(domain, text)
-        elif domain.endswith(".name"):
-            return WhoisName(domain, text)
-        elif domain.endswith(".me"):
-            return WhoisMe(domain, text)
-        elif domain.endswith(".ae"):
-            return WhoisAe(domain, text)
-        elif domain.endswith(".au"):
-            return WhoisAU(domain, text)
-        elif domain.endswith(".ru"):
-            return WhoisRu(domain, text)
-        elif domain.endswith(".us"):
-            return WhoisUs(domain, text)
-        elif domain.endswith(".uk"):
-            return WhoisUk(domain, text)
-        elif domain.endswith(".fr"):
-            return WhoisFr(domain, text)
-        elif domain.endswith(".nl"):
-            return WhoisNl(domain, text)
-        elif domain.endswith(".lt"):
-            return WhoisLt(domain, text)
-        elif domain.endswith(".fi"):
-            return WhoisFi(domain, text)
-        elif domain.endswith(".hr"):
-            return WhoisHr(domain, text)
-        elif domain.endswith(".hn"):
-            return WhoisHn(domain, text)
-        elif domain.endswith(".hk"):
-            return WhoisHk(domain, text)
-        elif domain.endswith(".jp"):
-            return WhoisJp(domain, text)
-        elif domain.endswith(".pl"):
-            return WhoisPl(domain, text)
-        elif domain.endswith(".br"):
-            return WhoisBr(domain, text)
-        elif domain.endswith(".eu"):
-            return WhoisEu(domain, text)
-        elif domain.endswith(".ee"):
-            return WhoisEe(domain, text)
-        elif domain.endswith(".kr"):
-            return WhoisKr(domain, text)
-        elif domain.endswith(".pt"):
-            return WhoisPt(domain, text)
-        elif domain.endswith(".bg"):
-            return WhoisBg(domain, text)
-        elif domain.endswith(".de"):
-            return WhoisDe(domain, text)
-        elif domain.endswith(".at"):
-            return WhoisAt(domain, text)
-        elif domain.endswith(".ca"):
-            return WhoisCa(domain, text)
-        elif domain.endswith(".be"):
-            return WhoisBe(domain, text)
-        elif domain.endswith(".рф"):
-            return WhoisRf(domain, text)
-        elif domain.endswith(".info"):
-            return WhoisInfo(domain, text)
-        elif domain.endswith(".su"):
-            return WhoisSu(domain, text)
-        elif domain.endswith(".si"):
-            return WhoisSi(domain, text)
-        elif domain.endswith(".kg"):
-            return WhoisKg(domain, text)
-        elif domain.endswith(".io"):
-            return WhoisIo(domain, text)
-        elif domain.endswith(".biz"):
-            return WhoisBiz(domain, text)
-        elif domain.endswith(".mobi"):
-            return WhoisMobi(domain, text)
-        elif domain.endswith(".ch"):
-            return WhoisChLi(domain, text)
-        elif domain.endswith(".li"):
-            return WhoisChLi(domain, text)
-        elif domain.endswith(".id"):
-            return WhoisID(domain, text)
-        elif domain.endswith(".sk"):
-            return WhoisSK(domain, text)
-        elif domain.endswith(".se"):
-            return WhoisSe(domain, text)
-        elif domain.endswith(".no"):
-            return WhoisNo(domain, text)
-        elif domain.endswith(".nu"):
-            return WhoisSe(domain, text)
-        elif domain.endswith(".is"):
-            return WhoisIs(domain, text)
-        elif domain.endswith(".dk"):
-            return WhoisDk(domain, text)
-        elif domain.endswith(".it"):
-            return WhoisIt(domain, text)
-        elif domain.endswith(".mx"):
-            return WhoisMx(domain, text)
-        elif domain.endswith(".ai"):
-            return WhoisAi(domain, text)
-        elif domain.endswith(".il"):
-            return WhoisIl(domain, text)
-        elif domain.endswith(".in"):
-            return WhoisIn(domain, text)
-        elif domain.endswith(".cat"):
-            return WhoisCat(domain, text)
-        elif domain.endswith(".ie"):
-            return WhoisIe(domain, text)
-        elif domain.endswith(".nz"):
-            return WhoisNz(domain, text)
-        elif domain.endswith(".space"):
-            return WhoisSpace(domain, text)
-        elif domain.endswith(".lu"):
-            return WhoisLu(domain, text)
-        elif domain.endswith(".cz"):
-            return WhoisCz(domain, text)
-        elif domain.endswith(".online"):
-            return WhoisOnline(domain, text)
-        elif domain.endswith(".cn"):
-            return WhoisCn(domain, text)
-        elif domain.endswith(".app"):
-            return WhoisApp(domain, text)
-        elif domain.endswith(".money"):
-            return WhoisMoney(domain, text)
-        elif domain.endswith(".cl"):
-            return WhoisCl(domain, text)
-        elif domain.endswith(".ar"):
-            return WhoisAr(domain, text)
-        elif domain.endswith(".by"):
-            return WhoisBy(domain, text)
-        elif domain.endswith(".cr"):
-            return WhoisCr(domain, text)
-        elif domain.endswith(".do"):
-            return WhoisDo(domain, text)
-        elif domain.endswith(".jobs"):
-            return WhoisJobs(domain, text)
-        elif domain.endswith(".lat"):
-            return WhoisLat(domain, text)
-        elif domain.endswith(".pe"):
-            return WhoisPe(domain, text)
-        elif domain.endswith(".ro"):
-            return WhoisRo(domain, text)
-        elif domain.endswith(".sa"):
-            return WhoisSa(domain, text)
-        elif domain.endswith(".tw"):
-            return WhoisTw(domain, text)
-        elif domain.endswith(".tr"):
-            return WhoisTr(domain, text)
-        elif domain.endswith(".ve"):
-            return WhoisVe(domain, text)
-        elif domain.endswith(".ua"):
-            if domain.endswith(".pp.ua"):
-                return WhoisPpUa(domain, text)
-            return WhoisUA(domain, text)
-        elif domain.endswith(".укр") or domain.endswith(".xn--j1amh"):
-            return WhoisUkr(domain, text)
-        elif domain.endswith(".kz"):
-            return WhoisKZ(domain, text)
-        elif domain.endswith(".ir"):
-            return WhoisIR(domain, text)
-        elif domain.endswith(".中国"):
-            return WhoisZhongGuo(domain, text)
-        elif domain.endswith(".website"):
-            return WhoisWebsite(domain, text)
-        elif domain.endswith(".sg"):
-            return WhoisSG(domain, text)
-        elif domain.endswith(".ml"):
-            return WhoisML(domain, text)
-        elif domain.endswith(".ooo"):
-            return WhoisOoo(domain, text)
-        elif domain.endswith(".group"):
-            return WhoisGroup(domain, text)
-        elif domain.endswith(".market"):
-            return WhoisMarket(domain, text)
-        elif domain.endswith(".za"):
-            return WhoisZa(domain, text)
-        elif domain.endswith(".bw"):
-            return WhoisBw(domain, text)
-        elif domain.endswith(".bz"):
-            return WhoisBz(domain, text)
-        elif domain.endswith(".gg"):
-            return WhoisGg(domain, text)
-        elif domain.endswith(".city"):
-            return WhoisCity(domain, text)
-        elif domain.endswith(".design"):
-            return WhoisDesign(domain, text)
-        elif domain.endswith(".studio"):
-            return WhoisStudio(domain, text)
-        elif domain.endswith(".style"):
-            return WhoisStyle(domain, text)
-        elif domain.endswith(".рус") or domain.endswith(".xn--p1acf"):
-            return WhoisPyc(domain, text)
-        elif domain.endswith(".life"):
-            return WhoisLife(domain, text)
-        elif domain.endswith(".tn"):
-            return WhoisTN(domain, text)
-        elif domain.endswith(".rs"):
-            return WhoisRs(domain, text)
-        elif domain.endswith(".site"):
-            return WhoisSite(domain, text)
-        elif domain.endswith(".edu"):
-            return WhoisEdu(domain, text)
-        elif domain.endswith(".lv"):
-            return WhoisLv(domain, text)
+        _, dot, tld = domain.rpartition(".")
+        if dot and domain.endswith(".pp.ua"):
+            return WhoisPpUa(domain, text)
+        elif dot and tld in TLD_CLASSES:
+            return TLD_CLASSES[tld](domain, text)
         else:
             return WhoisEntry(domain, text)
 
@@ -399,6 +447,8 @@ class WhoisEntry(dict):
 class WhoisCl(WhoisEntry):
     """Whois parser for .cl domains"""
 
+    not_found = ('No match for "',)
+
     regex = {
         "domain_name": r"Domain name: *(.+)",
         "registrant_name": r"Registrant name: *(.+)",
@@ -410,16 +460,12 @@ class WhoisCl(WhoisEntry):
         "name_servers": r"Name server: *(.+)",  # list of name servers
     }
 
-    def __init__(self, domain, text):
-        if 'No match for "' in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisSG(WhoisEntry):
     """Whois parser for .sg domains"""
 
+    not_found = ("Domain Not Found",)
+
     regex = {
         "domain_name": r"Domain name: *(.+)",
         "status": r"Domain Status: *(.+)",
@@ -433,10 +479,7 @@ class WhoisSG(WhoisEntry):
     }
 
     def __init__(self, domain, text):
-        if "Domain Not Found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
+        WhoisEntry.__init__(self, domain, text, self.regex)
 
         nsmatch = re.compile("Name Servers:(.*?)DNSSEC:", re.DOTALL).search(text)
         if nsmatch:
@@ -450,13 +493,15 @@ class WhoisSG(WhoisEntry):
         if techmatch:
             for line in techmatch.groups()[0].strip().splitlines():
                 self[
-                    "technical_contact_" + line.split(":")[0].strip().lower()
+                    "technical_contact_" + line.partition(":")[0].strip().lower()
                 ] = line.split(":")[1].strip()
 
 
 class WhoisPe(WhoisEntry):
     """Whois parser for .pe domains"""
 
+    not_found = ('No match for "',)
+
     regex = {
         "domain_name": r"Domain name: *(.+)",
         "status": r"Domain Status: *(.+)",
@@ -469,41 +514,23 @@ class WhoisPe(WhoisEntry):
         "name_servers": r"Name server: *(.+)",  # list of name servers
     }
 
-    def __init__(self, domain, text):
-        if 'No match for "' in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisSpace(WhoisEntry):
     """Whois parser for .space domains"""
 
-    def __init__(self, domain, text):
-        if 'No match for "' in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text)
+    not_found = ('No match for "',)
 
 
 class WhoisCom(WhoisEntry):
     """Whois parser for .com domains"""
 
-    def __init__(self, domain, text):
-        if 'No match for "' in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text)
+    not_found = ('No match for "',)
 
 
 class WhoisNet(WhoisEntry):
     """Whois parser for .net domains"""
 
-    def __init__(self, domain, text):
-        if 'No match for "' in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text)
+    not_found = ('No match for "',)
 
 
 class WhoisOrg(WhoisEntry):
@@ -528,7 +555,8 @@ class WhoisOrg(WhoisEntry):
         ):
             raise PywhoisError(text)
         else:
-            WhoisEntry.__init__(self, domain, text)
+            # .org has always been parsed with the generic patterns
+            WhoisEntry.__init__(self, domain, text, self._regex)
 
 
 class WhoisRo(WhoisEntry):
@@ -556,6 +584,8 @@ class WhoisRo(WhoisEntry):
 class WhoisRu(WhoisEntry):
     """Whois parser for .ru domains"""
 
+    not_found = ("No entries found",)
+
     regex = {
         "domain_name": r"domain: *(.+)",
         "registrar": r"registrar: *(.+)",
@@ -568,12 +598,6 @@ class WhoisRu(WhoisEntry):
         "org": r"org: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No entries found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisNl(WhoisEntry):
     """Whois parser for .nl domains"""
@@ -607,7 +631,7 @@ class WhoisNl(WhoisEntry):
                 line.strip() for line in match.groups()[0].strip().splitlines()
             ]
             duplicate_nameservers_without_ip = [
-                nameserver.split(" ")[0] for nameserver in duplicate_nameservers_with_ip
+                nameserver.partition(" ")[0] for nameserver in duplicate_nameservers_with_ip
             ]
             self["name_servers"] = sorted(list(set(duplicate_nameservers_without_ip)))
 
@@ -637,7 +661,7 @@ class WhoisLt(WhoisEntry):
                 line.strip() for line in match.groups()[0].strip().splitlines()
             ]
             duplicate_nameservers_without_ip = [
-                nameserver.split(" ")[0] for nameserver in duplicate_nameservers_with_ip
+                nameserver.partition(" ")[0] for nameserver in duplicate_nameservers_with_ip
             ]
             self["name_servers"] = sorted(list(set(duplicate_nameservers_without_ip)))
 
@@ -645,6 +669,8 @@ class WhoisLt(WhoisEntry):
 class WhoisName(WhoisEntry):
     """Whois parser for .name domains"""
 
+    not_found = ("No match for ",)
+
     regex = {
         "domain_name_id": r"Domain Name ID: *(.+)",
         "domain_name": r"Domain Name: *(.+)",
@@ -662,16 +688,12 @@ class WhoisName(WhoisEntry):
         "status": r"Domain Status: *(.+)",  # list of statuses
     }
 
-    def __init__(self, domain, text):
-        if "No match for " in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisUs(WhoisEntry):
     """Whois parser for .us domains"""
 
+    not_found = ("Not found:",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "domain__id": r"Domain ID: *(.+)",
@@ -727,16 +749,12 @@ class WhoisUs(WhoisEntry):
         "updated_date": r"Updated Date: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "Not found:" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisPl(WhoisEntry):
     """Whois parser for .pl domains"""
 
+    not_found = ("No information available about domain name",)
+
     regex = {
         "domain_name": r"DOMAIN NAME: *(.+)\n",
         "name_servers": r"nameservers:(?:\s+(\S+)\.[^\n]*\n)(?:\s+(\S+)\.[^\n]*\n)?(?:\s+(\S+)\.[^\n]*\n)?(?:\s+(\S+)\.[^\n]*\n)?", # up to 4
@@ -749,16 +767,12 @@ class WhoisPl(WhoisEntry):
         "updated_date": r"last modified: *(.+)\n",
     }
 
-    def __init__(self, domain, text):
-        if "No information available about domain name" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisGroup(WhoisEntry):
     """Whois parser for .group domains"""
 
+    not_found = ("Domain not found",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "domain_id": r"Registry Domain ID:(.+)",
@@ -773,16 +787,12 @@ class WhoisGroup(WhoisEntry):
         "name_servers": r"Name Server: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "Domain not found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisCa(WhoisEntry):
     """Whois parser for .ca domains"""
 
+    not_found = ("Domain status:         available", "Not found:")
+
     regex = {
         "domain_name": r"Domain name: *(.+)",
         "whois_server": r"Registrar WHOIS Server: *(.+)",
@@ -802,16 +812,12 @@ class WhoisCa(WhoisEntry):
         "name_servers": r"Name Server: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "Domain status:         available" in text or "Not found:" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisMe(WhoisEntry):
     """Whois parser for .me domains"""
 
+    not_found = ("NOT FOUND",)
+
     regex = {
         "domain_id": r"Registry Domain ID:(.+)",
         "domain_name": r"Domain Name:(.+)",
@@ -868,16 +874,12 @@ class WhoisMe(WhoisEntry):
         "name_servers": r"Nameservers:(.+)",  # list of name servers
     }
 
-    def __init__(self, domain, text):
-        if "NOT FOUND" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisUk(WhoisEntry):
     """Whois parser for .uk domains"""
 
+    not_found = ("No match for ",)
+
     regex = {
         "domain_name": r"Domain name:\s*(.+)",
         "registrar": r"Registrar:\s*(.+)",
@@ -894,16 +896,12 @@ class WhoisUk(WhoisEntry):
         "name_servers": r"([\w.-]+\.(?:[\w-]+\.){1,2}[a-zA-Z]{2,}(?!\s+Relevant|\s+Data))\s+",
     }
 
-    def __init__(self, domain, text):
-        if "No match for " in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisFr(WhoisEntry):
     """Whois parser for .fr domains"""
 
+    not_found = ("No entries found",)
+
     regex = {
         "domain_name": r"domain: *(.+)",
         "registrar": r"registrar: *(.+)",
@@ -915,16 +913,12 @@ class WhoisFr(WhoisEntry):
         "updated_date": r"last-update: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No entries found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisFi(WhoisEntry):
     """Whois parser for .fi domains"""
 
+    not_found = ("Domain not ",)
+
     regex = {
         "domain_name": r"domain\.*: *([\S]+)",
         "name": r"Holder\s*name\.*: (.+)",
@@ -944,12 +938,6 @@ class WhoisFi(WhoisEntry):
 
     dayfirst = True
 
-    def __init__(self, domain, text):
-        if "Domain not " in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisJp(WhoisEntry):
     """Parser for .jp domains
@@ -959,7 +947,7 @@ class WhoisJp(WhoisEntry):
         nintendo.co.jp
 
     """
-    not_found = "No match!!"
+    not_found = ("No match!!",)
     regex = {
         "domain_name": r"^(?:a\. )?\[Domain Name\]\s*(.+)",
         "registrant_org": r"^(?:g\. )?\[(?:Organization|Registrant)\](.+)",
@@ -981,12 +969,6 @@ class WhoisJp(WhoisEntry):
         "status": r"\[(?:State|Status)\]\s*(.+)",  # list
     }
 
-    def __init__(self, domain: str, text: str):
-        if self.not_found in text:
-            raise PywhoisError(text)
-
-        super().__init__(domain, text, self.regex)
-
 
 class WhoisAU(WhoisEntry):
     """Whois parser for .au domains"""
@@ -1095,6 +1077,8 @@ class WhoisEe(WhoisEntry):
 class WhoisBr(WhoisEntry):
     """Whois parser for .br domains"""
 
+    not_found = ("Not found:",)
+
     regex = {
         "domain_name": r"domain: *(.+)\n",
         "registrant_name": r"owner: *([\S ]+)",
@@ -1117,12 +1101,6 @@ class WhoisBr(WhoisEntry):
         "email": r"e-mail: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "Not found:" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
     def _preprocess(self, attr, value):
         value = value.strip()
         if value and isinstance(value, str) and "_date" in attr:
@@ -1190,6 +1168,8 @@ class WhoisPt(WhoisEntry):
 class WhoisBg(WhoisEntry):
     """Whois parser for .bg domains"""
 
+    not_found = ("does not exist in database!",)
+
     regex = {
         "domain_name": r"DOMAIN NAME: *(.+)\n",
         "status": r"registration status: s*(.+)",
@@ -1197,16 +1177,12 @@ class WhoisBg(WhoisEntry):
     }
     dayfirst = True
 
-    def __init__(self, domain, text):
-        if "does not exist in database!" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisDe(WhoisEntry):
     """Whois parser for .de domains"""
 
+    not_found = ("Status: free",)
+
     regex = {
         "domain_name": r"Domain: *(.+)",
         "status": r"Status: *(.+)",
@@ -1224,16 +1200,12 @@ class WhoisDe(WhoisEntry):
         "created": r"created: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "Status: free" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisAt(WhoisEntry):
     """Whois parser for .at domains"""
 
+    not_found = ("Status: free",)
+
     regex = {
         "domain_name": r"domain: *(.+)",
         "registrar": r"registrar: *(.+)",
@@ -1250,16 +1222,12 @@ class WhoisAt(WhoisEntry):
         "email": r"e-mail: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "Status: free" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisBe(WhoisEntry):
     """Whois parser for .be domains"""
 
+    not_found = ("Status: AVAILABLE",)
+
     regex = {
         "domain_name": r"Domain: *(.+)",
         "status": r"Status: *(.+)",
@@ -1272,12 +1240,6 @@ class WhoisBe(WhoisEntry):
         "name_servers": r"Nameservers:\s((?:\s+?[\w.]+\s)*)",  # list of name servers
     }
 
-    def __init__(self, domain, text):
-        if "Status: AVAILABLE" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisInfo(WhoisEntry):
     """Whois parser for .info domains"""
@@ -1312,20 +1274,16 @@ class WhoisInfo(WhoisEntry):
 class WhoisRf(WhoisRu):
     """Whois parser for .su domains"""
 
-    def __init__(self, domain, text):
-        WhoisRu.__init__(self, domain, text)
-
 
 class WhoisSu(WhoisRu):
     """Whois parser for .su domains"""
 
-    def __init__(self, domain, text):
-        WhoisRu.__init__(self, domain, text)
-
 
 class WhoisBz(WhoisRu):
     """Whois parser for .bz domains"""
 
+    not_found = ("No entries found",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "domain_id": r"Registry Domain ID: *(.+)",
@@ -1375,46 +1333,30 @@ class WhoisBz(WhoisRu):
         "dnssec": r"DNSSEC: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No entries found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisCity(WhoisRu):
     """Whois parser for .city domains"""
 
-    def __init__(self, domain, text):
-        WhoisRu.__init__(self, domain, text)
-
 
 class WhoisStudio(WhoisBz):
     """Whois parser for .studio domains"""
 
-    def __init__(self, domain, text):
-        if "Domain not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
+    not_found = ("Domain not found.",)
+
 
 class WhoisStyle(WhoisRu):
     """Whois parser for .style domains"""
 
-    def __init__(self, domain, text):
-        WhoisRu.__init__(self, domain, text)
-
 
 class WhoisPyc(WhoisRu):
     """Whois parser for .рус domains"""
 
-    def __init__(self, domain, text):
-        WhoisRu.__init__(self, domain, text)
-
 
 class WhoisClub(WhoisEntry):
     """Whois parser for .us domains"""
 
+    not_found = ("Not found:",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "domain__id": r"Domain ID: *(.+)",
@@ -1484,16 +1426,12 @@ class WhoisClub(WhoisEntry):
         "updated_date": r"Domain Last Updated Date: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "Not found:" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisIo(WhoisEntry):
     """Whois parser for .io domains"""
 
+    not_found = ("is available for purchase",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "domain__id": r"Registry Domain ID: *(.+)",
@@ -1510,16 +1448,12 @@ class WhoisIo(WhoisEntry):
         "updated_date": r"Updated Date: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "is available for purchase" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisBiz(WhoisEntry):
     """Whois parser for .biz domains"""
 
+    not_found = ("No Data Found",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "domain__id": r"Domain ID: *(.+)",
@@ -1565,16 +1499,12 @@ class WhoisBiz(WhoisEntry):
         "updated_date": r"Updated Date: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No Data Found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisMobi(WhoisEntry):
     """Whois parser for .mobi domains"""
 
+    not_found = ("NOT FOUND",)
+
     regex = {
         "domain_id": r"Registry Domain ID:(.+)",
         "domain_name": r"Domain Name:(.+)",
@@ -1631,16 +1561,12 @@ class WhoisMobi(WhoisEntry):
         "name_servers": r"Name Server: *(.+)",  # list of name servers
     }
 
-    def __init__(self, domain, text):
-        if "NOT FOUND" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisKg(WhoisEntry):
     """Whois parser for .kg domains"""
 
+    not_found = ("Data not found. This domain is available for registration",)
+
     regex = {
         "domain_name": r"Domain\s*([\w]+\.[\w]{2,5})",
         "registrar": r"Domain support: \s*(.+)",
@@ -1656,16 +1582,12 @@ class WhoisKg(WhoisEntry):
         "updated_date": r"Record last updated on\s*(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "Data not found. This domain is available for registration" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisChLi(WhoisEntry):
     """Whois Parser for .ch and .li domains"""
 
+    not_found = ("We do not have an entry in our database matching your query.",)
+
     regex = {
         "domain_name": r"\nDomain name:\n*(.+)",
         "registrant_name": r"Holder of domain name:\s*(?:.*\n){1}\s*(.+)",
@@ -1677,16 +1599,12 @@ class WhoisChLi(WhoisEntry):
         "name_servers": r"Name servers:\n *([\n\S\s]+)",
     }
 
-    def __init__(self, domain, text):
-        if "We do not have an entry in our database matching your query." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisID(WhoisEntry):
     """Whois parser for .id domains"""
 
+    not_found = ("NOT FOUND",)
+
     regex = {
         "domain_id": r"Domain ID:(.+)",
         "domain_name": r"Domain Name:(.+)",
@@ -1716,16 +1634,12 @@ class WhoisID(WhoisEntry):
         "name_servers": r"Name Server:(.+)",  # list of name servers
     }
 
-    def __init__(self, domain, text):
-        if "NOT FOUND" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisSe(WhoisEntry):
     """Whois parser for .se domains"""
 
+    not_found = ("not found.",)
+
     regex = {
         "domain_name": r"domain\.*: *(.+)",
         "registrant_name": r"holder\.*: *(.+)",
@@ -1739,16 +1653,12 @@ class WhoisSe(WhoisEntry):
         "registrar": r"registrar: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisJobs(WhoisEntry):
     """Whois parser for .jobs domains"""
 
+    not_found = ("not found.",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "domain_id": r"Registry Domain ID: *(.+)",
@@ -1808,16 +1718,12 @@ class WhoisJobs(WhoisEntry):
         "name_servers": r"Name Server: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisIt(WhoisEntry):
     """Whois parser for .it domains"""
 
+    not_found = ("not found.",)
+
     regex = {
         "domain_name": r"Domain: *(.+)",
         "creation_date": r"(?<! )Created: *(.+)",
@@ -1838,16 +1744,12 @@ class WhoisIt(WhoisEntry):
         "registrar_name": r"(?<=Registrar)[\s\S]*?Name:(.*)",
     }
 
-    def __init__(self, domain, text):
-        if "not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisSa(WhoisEntry):
     """Whois parser for .sa domains"""
 
+    not_found = ("not found.",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "creation_date": r"Created on: *(.+)",
@@ -1861,16 +1763,12 @@ class WhoisSa(WhoisEntry):
         "tech": r"Technical Contact:\s*(.*)",
     }
 
-    def __init__(self, domain, text):
-        if "not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisSK(WhoisEntry):
     """Whois parser for .sk domains"""
 
+    not_found = ("not found.",)
+
     regex = {
         "domain_name": r"Domain: *(.+)",
         "creation_date": r"(?<=Domain:)[\s\w\W]*?Created: *(.+)",
@@ -1897,16 +1795,12 @@ class WhoisSK(WhoisEntry):
         "admin_country_code": r"(?<=Contact)[\s\S]*Country Code:(.*)",
     }
 
-    def __init__(self, domain, text):
-        if "not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisMx(WhoisEntry):
     """Whois parser for .mx domains"""
 
+    not_found = ("not found.",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "creation_date": r"Created On: *(.+)",
@@ -1933,16 +1827,12 @@ class WhoisMx(WhoisEntry):
         "billing_country": r"(?<=Billing Contact)[\s\S]*?Country:(.*)",
     }
 
-    def __init__(self, domain, text):
-        if "not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisTw(WhoisEntry):
     """Whois parser for .tw domains"""
 
+    not_found = ("not found.",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "creation_date": r"Record created on (.+) ",
@@ -1970,16 +1860,12 @@ class WhoisTw(WhoisEntry):
         "tech_fax": r"(?<=Technical Contact:\n)\s*(?:.*\n){2}\s+(\+*\d.*)",
     }
 
-    def __init__(self, domain, text):
-        if "not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisTr(WhoisEntry):
     """Whois parser for .tr domains"""
 
+    not_found = ("not found.",)
+
     regex = {
         "domain_name": r"[**] Domain Name: *(.+)",
         "creation_date": r"Created on.*: *(.+)",
@@ -2005,16 +1891,12 @@ class WhoisTr(WhoisEntry):
         "billing_fax": r"(?<=[**] Billing Contact)[\s\S]*?Fax\s+: (.*)",
     }
 
-    def __init__(self, domain, text):
-        if "not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisIs(WhoisEntry):
     """Whois parser for .se domains"""
 
+    not_found = ("No entries found",)
+
     regex = {
         "domain_name": r"domain\.*: *(.+)",
         "registrant_name": r"registrant: *(.+)",
@@ -2027,16 +1909,12 @@ class WhoisIs(WhoisEntry):
         "dnssec": r"dnssec\.*: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No entries found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisDk(WhoisEntry):
     """Whois parser for .dk domains"""
 
+    not_found = ("No match for ",)
+
     regex = {
         "domain_name": r"Domain: *(.+)",
         "creation_date": r"Registered: *(.+)",
@@ -2053,16 +1931,10 @@ class WhoisDk(WhoisEntry):
         "name_servers": r"Nameservers\n *([\n\S\s]+)",
     }
 
-    def __init__(self, domain, text):
-        if "No match for " in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
     def _preprocess(self, attr, value):
         if attr == "name_servers":
             return [
-                line.split(":")[-1].strip()
+                line.rpartition(":")[2].strip()
                 for line in value.split("\n")
                 if line.startswith("Hostname")
             ]
@@ -2072,6 +1944,8 @@ class WhoisDk(WhoisEntry):
 class WhoisAi(WhoisEntry):
     """Whois parser for .ai domains"""
 
+    not_found = ("not registered",)
+
     # More permissive with postal code
     # Should be compatible with the previous format in case it returns
     regex = {
@@ -2120,16 +1994,13 @@ class WhoisAi(WhoisEntry):
         "billing_email": r"Billing\s*Email\.*:\s*(.+)",
         "name_servers": r"Name Server\.*:\s*(.+)",
     }
-    def __init__(self, domain, text):
-        if "not registered" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
 
 
 class WhoisIl(WhoisEntry):
     """Whois parser for .il domains"""
 
+    not_found = ("No data was found",)
+
     regex = {
         "domain_name": r"domain: *(.+)",
         "expiration_date": r"validity: *(.+)",
@@ -2145,12 +2016,6 @@ class WhoisIl(WhoisEntry):
     }
     dayfirst = True
 
-    def __init__(self, domain, text):
-        if "No data was found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
     def _preprocess(self, attr, value):
         if attr == "emails":
             value = value.replace(" AT ", "@")
@@ -2160,6 +2025,8 @@ class WhoisIl(WhoisEntry):
 class WhoisIn(WhoisEntry):
     """Whois parser for .in domains"""
 
+    not_found = ("NOT FOUND",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "registrar": r"Registrar: *(.+)",
@@ -2177,16 +2044,12 @@ class WhoisIn(WhoisEntry):
         "dnssec": r"DNSSEC: *([\S]+)",
     }
 
-    def __init__(self, domain, text):
-        if "NOT FOUND" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisCat(WhoisEntry):
     """Whois parser for .cat domains"""
 
+    not_found = ("no matching objects",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "registrar": r"Registrar: *(.+)",
@@ -2199,18 +2062,17 @@ class WhoisCat(WhoisEntry):
     }
 
     def __init__(self, domain, text):
-        if "no matching objects" in text:
-            raise PywhoisError(text)
-        else:
-            # Merge base class regex with specifics
-            self._regex.copy().update(self.regex)
-            self.regex = self._regex
-            WhoisEntry.__init__(self, domain, text, self.regex)
+        # Merge base class regex with specifics
+        self._regex.copy().update(self.regex)
+        self.regex = self._regex
+        WhoisEntry.__init__(self, domain, text, self.regex)
 
 
 class WhoisIe(WhoisEntry):
     """Whois parser for .ie domains"""
 
+    not_found = ("no matching objects",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "creation_date": r"Creation Date: *(.+)",
@@ -2223,16 +2085,12 @@ class WhoisIe(WhoisEntry):
         "registrar_contact": r"Registrar Abuse Contact Email: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "no matching objects" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisNz(WhoisEntry):
     """Whois parser for .nz domains"""
 
+    not_found = ("no matching objects",)
+
     regex = {
         "domain_name": r"domain_name:\s*([^\n\r]+)",
         "registrar": r"registrar_name:\s*([^\n\r]+)",
@@ -2249,16 +2107,12 @@ class WhoisNz(WhoisEntry):
         "country": r"registrant_contact_country:\s*([^\n\r]+)",
     }
 
-    def __init__(self, domain, text):
-        if "no matching objects" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisLu(WhoisEntry):
     """Whois parser for .lu domains"""
 
+    not_found = ("No such domain",)
+
     regex = {
         "domain_name": r"domainname: *(.+)",
         "creation_date": r"registered: *(.+)",
@@ -2284,16 +2138,12 @@ class WhoisLu(WhoisEntry):
         "tech_email": r"tec-email: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No such domain" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisCz(WhoisEntry):
     """Whois parser for .cz domains"""
 
+    not_found = ("% No entries found.", "Your connection limit exceeded")
+
     regex = {
         "domain_name": r"domain: *(.+)",
         "registrant_name": r"registrant: *(.+)",
@@ -2307,16 +2157,12 @@ class WhoisCz(WhoisEntry):
 
     dayfirst = True
 
-    def __init__(self, domain, text):
-        if "% No entries found." in text or "Your connection limit exceeded" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisOnline(WhoisEntry):
     """Whois parser for .online domains"""
 
+    not_found = ("Not found:",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "domain__id": r"Domain ID: *(.+)",
@@ -2336,16 +2182,12 @@ class WhoisOnline(WhoisEntry):
         "dnssec": r"DNSSEC: *([\S]+)",
     }
 
-    def __init__(self, domain, text):
-        if "Not found:" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisHr(WhoisEntry):
     """Whois parser for .hr domains"""
 
+    not_found = ("ERROR: No entries found",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "whois_server": r"Registrar WHOIS Server: *(.+)",
@@ -2358,16 +2200,12 @@ class WhoisHr(WhoisEntry):
         "registrant_address": r"Reigstrant Street:\s*(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "ERROR: No entries found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisHk(WhoisEntry):
     """Whois parser for .hk domains"""
 
+    not_found = ("ERROR: No entries found", "The domain has not been registered")
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "status": r"Domain Status: *(.+)",
@@ -2378,46 +2216,39 @@ class WhoisHk(WhoisEntry):
         "registrar_email": r"Registrar Contact Information: Email: *(.+)",
         "registrant_company_name": r"Registrant Contact Information:\s*Company English Name.*:(.+)",
         "registrant_address": r"(?<=Registrant Contact Information:)[\s\S]*?Address: (.*)",
-        "registrant_country": r"[Registrant Contact Information\w\W]+Country: ([\S\ ]+)",
-        "registrant_email": r"[Registrant Contact Information\w\W]+Email: ([\S\ ]+)",
-        "admin_name": r"[Administrative Contact Information\w\W]+Given name: ([\S\ ]+)",
-        "admin_family_name": r"[Administrative Contact Information\w\W]+Family name: ([\S\ ]+)",
-        "admin_company_name": r"[Administrative Contact Information\w\W]+Company name: ([\S\ ]+)",
+        "registrant_country": r"\A[Registrant Contact Information\w\W]+Country: ([\S\ ]+)",
+        "registrant_email": r"\A[Registrant Contact Information\w\W]+Email: ([\S\ ]+)",
+        "admin_name": r"\A[Administrative Contact Information\w\W]+Given name: ([\S\ ]+)",
+        "admin_family_name": r"\A[Administrative Contact Information\w\W]+Family name: ([\S\ ]+)",
+        "admin_company_name": r"\A[Administrative Contact Information\w\W]+Company name: ([\S\ ]+)",
         "admin_address": r"(?<=Administrative Contact Information:)[\s\S]*?Address: (.*)",
-        "admin_country": r"[Administrative Contact Information\w\W]+Country: ([\S\ ]+)",
-        "admin_phone": r"[Administrative Contact Information\w\W]+Phone: ([\S\ ]+)",
-        "admin_fax": r"[Administrative Contact Information\w\W]+Fax: ([\S\ ]+)",
-        "admin_email": r"[Administrative Contact Information\w\W]+Email: ([\S\ ]+)",
-        "admin_account_name": r"[Administrative Contact Information\w\W]+Account Name: ([\S\ ]+)",
-        "tech_name": r"[Technical Contact Information\w\W]+Given name: (.+)",
-        "tech_family_name": r"[Technical Contact Information\w\W]+Family name: (.+)",
-        "tech_company_name": r"[Technical Contact Information\w\W]+Company name: (.+)",
+        "admin_country": r"\A[Administrative Contact Information\w\W]+Country: ([\S\ ]+)",
+        "admin_phone": r"\A[Administrative Contact Information\w\W]+Phone: ([\S\ ]+)",
+        "admin_fax": r"\A[Administrative Contact Information\w\W]+Fax: ([\S\ ]+)",
+        "admin_email": r"\A[Administrative Contact Information\w\W]+Email: ([\S\ ]+)",
+        "admin_account_name": r"\A[Administrative Contact Information\w\W]+Account Name: ([\S\ ]+)",
+        "tech_name": r"\A[Technical Contact Information\w\W]+Given name: (.+)",
+        "tech_family_name": r"\A[Technical Contact Information\w\W]+Family name: (.+)",
+        "tech_company_name": r"\A[Technical Contact Information\w\W]+Company name: (.+)",
         "tech_address": r"(?<=Technical Contact Information:)[\s\S]*?Address: (.*)",
-        "tech_country": r"[Technical Contact Information\w\W]+Country: (.+)",
-        "tech_phone": r"[Technical Contact Information\w\W]+Phone: (.+)",
-        "tech_fax": r"[Technical Contact Information\w\W]+Fax: (.+)",
-        "tech_email": r"[Technical Contact Information\w\W]+Email: (.+)",
-        "tech_account_name": r"[Technical Contact Information\w\W]+Account Name: (.+)",
+        "tech_country": r"\A[Technical Contact Information\w\W]+Country: (.+)",
+        "tech_phone": r"\A[Technical Contact Information\w\W]+Phone: (.+)",
+        "tech_fax": r"\A[Technical Contact Information\w\W]+Fax: (.+)",
+        "tech_email": r"\A[Technical Contact Information\w\W]+Email: (.+)",
+        "tech_account_name": r"\A[Technical Contact Information\w\W]+Account Name: (.+)",
         "updated_date": r"Updated Date: *(.+)",
-        "creation_date": r"[Registrant Contact Information\w\W]+Domain Name Commencement Date: (.+)",
-        "expiration_date": r"[Registrant Contact Information\w\W]+Expiry Date: (.+)",
+        "creation_date": r"\A[Registrant Contact Information\w\W]+Domain Name Commencement Date: (.+)",
+        "expiration_date": r"\A[Registrant Contact Information\w\W]+Expiry Date: (.+)",
         "name_servers": r"Name Servers Information:\s+((?:.+\n)*)",
     }
     dayfirst = True
 
-    def __init__(self, domain, text):
-        if (
-            "ERROR: No entries found" in text
-            or "The domain has not been registered" in text
-        ):
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisUA(WhoisEntry):
     """Whois parser for .ua domains"""
 
+    not_found = ("ERROR: No entries found",)
+
     regex = {
         "domain_name": r"domain: *(.+)",
         "status": r"status: *(.+)",
@@ -2455,16 +2286,12 @@ class WhoisUA(WhoisEntry):
         "emails": EMAIL_REGEX,  # list of email addresses
     }
 
-    def __init__(self, domain, text):
-        if "ERROR: No entries found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisUkr(WhoisEntry):
     """Whois parser for .укр domains"""
 
+    not_found = ("No match for domain",)
+
     regex = {
         "domain_name": r"Domain name \(UTF8\): *(.+)",
         "domain_id": r"Registry Domain ID: *(.+)",
@@ -2497,12 +2324,6 @@ class WhoisUkr(WhoisEntry):
         "name_servers": r"Domain servers in listed order:\s+((?:.+\n)*)",
     }
 
-    def __init__(self, domain, text):
-        if "No match for domain" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
     def _preprocess(self, attr, value):
         if attr == "name_servers":
             return [line.strip() for line in value.split("\n") if line != ""]
@@ -2512,6 +2333,8 @@ class WhoisUkr(WhoisEntry):
 class WhoisPpUa(WhoisEntry):
     """Whois parser for .pp.ua domains"""
 
+    not_found = ("No entries found.",)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "domain_id": r"Domain ID: *(.+)",
@@ -2545,12 +2368,6 @@ class WhoisPpUa(WhoisEntry):
         "name_servers": r"Name Server: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No entries found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisHn(WhoisEntry):
     """Whois parser for .hn domains"""
@@ -2973,6 +2790,8 @@ class WhoisAe(WhoisEntry):
 class WhoisSi(WhoisEntry):
     """Whois parser for .si domains"""
 
+    not_found = ("No entries found for the selected source(s).",)
+
     regex = {
         "domain_name": r"domain: *(.+)",
         "registrar": r"registrar: *(.+)",
@@ -2982,32 +2801,24 @@ class WhoisSi(WhoisEntry):
         "expiration_date": r"expire: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No entries found for the selected source(s)." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisNo(WhoisEntry):
     """Whois parser for .no domains"""
 
+    not_found = ("No match",)
+
     regex = {
         "domain_name": r"Domain Name.*:\s*(.+)",
         "creation_date": r"Additional information:\nCreated:\s*(.+)",
         "updated_date": r"Additional information:\n(?:.*\n)Last updated:\s*(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No match" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisKZ(WhoisEntry):
     """Whois parser for .kz domains"""
 
+    not_found = ("*** Nothing found for this query.",)
+
     regex = {
         "domain_name": r"Domain Name............: *(.+)",
         "registrar_created": r"Registr?ar Created: *(.+)",
@@ -3020,16 +2831,12 @@ class WhoisKZ(WhoisEntry):
         "org": r"Organization Name.*: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "*** Nothing found for this query." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisIR(WhoisEntry):
     """Whois parser for .ir domains"""
 
+    not_found = ('No match for "',)
+
     regex = {
         "domain_name": r"domain: *(.+)",
         "registrant_name": r"person: *(.+)",
@@ -3040,16 +2847,12 @@ class WhoisIR(WhoisEntry):
         "emails": EMAIL_REGEX,
     }
 
-    def __init__(self, domain, text):
-        if 'No match for "' in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisLife(WhoisEntry):
     """Whois parser for .ir domains"""
 
+    not_found = ("Domain not found.",)
+
     regex = {
         "domain_name": r"Domain Name:: *(.+)",
         "registrant_name": r"Registrar: *(.+)",
@@ -3060,16 +2863,12 @@ class WhoisLife(WhoisEntry):
         "emails": EMAIL_REGEX,
     }
 
-    def __init__(self, domain, text):
-        if "Domain not found." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisZhongGuo(WhoisEntry):
     """Whois parser for .中国 domains"""
 
+    not_found = ('No match for "',)
+
     regex = {
         "domain_name": r"Domain Name: *(.+)",
         "creation_date": r"Registration Time: *(.+)",
@@ -3080,26 +2879,20 @@ class WhoisZhongGuo(WhoisEntry):
         "emails": EMAIL_REGEX,
     }
 
-    def __init__(self, domain, text):
-        if 'No match for "' in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisWebsite(WhoisEntry):
     """Whois parser for .website domains"""
 
-    def __init__(self, domain, text):
-        if 'No match for "' in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text)
+    not_found = ('No match for "',)
 
 
 class WhoisML(WhoisEntry):
     """Whois parser for .ml domains"""
 
+    not_found = (
+        "Invalid query or domain name not known in the Point ML Domain Registry",
+    )
+
     regex = {
         "domain_name": r"Domain name:\s*([^(i|\n)]+)",
         "registrar": r"Organization: *(.+)",
@@ -3109,15 +2902,6 @@ class WhoisML(WhoisEntry):
         "emails": EMAIL_REGEX,
     }
 
-    def __init__(self, domain, text):
-        if (
-            "Invalid query or domain name not known in the Point ML Domain Registry"
-            in text
-        ):
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
     def _preprocess(self, attr, value):
         if attr == "name_servers":
             return [line.strip() for line in value.split("\n") if line != ""]
@@ -3127,21 +2911,13 @@ class WhoisML(WhoisEntry):
 class WhoisOoo(WhoisEntry):
     """Whois parser for .ooo domains"""
 
-    def __init__(self, domain, text):
-        if "No entries found for the selected source(s)." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
+    not_found = ("No entries found for the selected source(s).",)
 
 
 class WhoisMarket(WhoisEntry):
     """Whois parser for .market domains"""
 
-    def __init__(self, domain, text):
-        if "No entries found for the selected source(s)." in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
+    not_found = ("No entries found for the selected source(s).",)
 
 
 class WhoisZa(WhoisEntry):
@@ -3221,22 +2997,20 @@ class WhoisZa(WhoisEntry):
 class WhoisGg(WhoisEntry):
     """Whois parser for .gg domains"""
 
+    not_found = ("NOT FOUND",)
+
     regex = {
         "domain_name": r"Domain:\n +(.+)",
         "registrar": r"Registrar:\n\s+(.+)",
         "creation_date": r"Relevant dates:\n\s+Registered on (.+)",
     }
 
-    def __init__(self, domain, text):
-        if "NOT FOUND" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisBw(WhoisEntry):
     """Whois parser for .bw domains"""
 
+    not_found = ("not registered",)
+
     regex = {
         "domain_name": r"Domain Name\.*: *(.+)",
         "domain_id": r"Registry Domain ID\.*: *(.+)",
@@ -3274,12 +3048,6 @@ class WhoisBw(WhoisEntry):
         "dnssec": r"dnssec\.*: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "not registered" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisTN(WhoisEntry):
     """Whois parser for .tn domains"""
@@ -3334,6 +3102,8 @@ class WhoisTN(WhoisEntry):
 class WhoisSite(WhoisEntry):
     """Whois parser for .site domains"""
 
+    not_found = ("DOMAIN NOT FOUND",)
+
     _regex = {
         "domain_name": r"Domain Name: *(.+)",
         "registrar": r"Registrar: *(.+)",
@@ -3354,16 +3124,12 @@ class WhoisSite(WhoisEntry):
         "country": r"Registrant Country: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "DOMAIN NOT FOUND" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisDesign(WhoisEntry):
     """Whois parser for .design domains"""
 
+    not_found = ("No Data Found",)
+
     _regex = {
         "domain_name": r"Domain Name: *(.+)",
         "registrar": r"Registrar URL: *(.+)",
@@ -3385,12 +3151,6 @@ class WhoisDesign(WhoisEntry):
         "country": r"Registrant Country: *(.+)",
     }
 
-    def __init__(self, domain, text):
-        if "No Data Found" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
-
 
 class WhoisEdu(WhoisEntry):
     """Whois parser for .edu domains"""
@@ -3408,9 +3168,12 @@ class WhoisEdu(WhoisEntry):
         else:
             WhoisEntry.__init__(self, domain, text, self.regex)
 
+
 class WhoisLv(WhoisEntry):
     """Whois parser for .lv domains"""
 
+    not_found = ("Status: free",)
+
     regex = {
         "domain_name": r"\[Domain\]\nDomain: *(.+)",
         "registrant_name": r"\[Holder\]\n\s+Type: .*\n\s+Name: *(.+)",
@@ -3423,8 +3186,109 @@ class WhoisLv(WhoisEntry):
         "updated_date": r"\[Whois\]\nUpdated: (.+)",
     }
 
-    def __init__(self, domain, text):
-        if "Status: free" in text:
-            raise PywhoisError(text)
-        else:
-            WhoisEntry.__init__(self, domain, text, self.regex)
+
+# WhoisEntry.load picks the class for a domain from its top level domain
+TLD_CLASSES = {
+    "com": WhoisCom,
+    "net": WhoisNet,
+    "org": WhoisOrg,
+    "name": WhoisName,
+    "me": WhoisMe,
+    "ae": WhoisAe,
+    "au": WhoisAU,
+    "ru": WhoisRu,
+    "us": WhoisUs,
+    "uk": WhoisUk,
+    "fr": WhoisFr,
+    "nl": WhoisNl,
+    "lt": WhoisLt,
+    "fi": WhoisFi,
+    "hr": WhoisHr,
+    "hn": WhoisHn,
+    "hk": WhoisHk,
+    "jp": WhoisJp,
+    "pl": WhoisPl,
+    "br": WhoisBr,
+    "eu": WhoisEu,
+    "ee": WhoisEe,
+    "kr": WhoisKr,
+    "pt": WhoisPt,
+    "bg": WhoisBg,
+    "de": WhoisDe,
+    "at": WhoisAt,
+    "ca": WhoisCa,
+    "be": WhoisBe,
+    "рф": WhoisRf,
+    "info": WhoisInfo,
+    "su": WhoisSu,
+    "si": WhoisSi,
+    "kg": WhoisKg,
+    "io": WhoisIo,
+    "biz": WhoisBiz,
+    "mobi": WhoisMobi,
+    "ch": WhoisChLi,
+    "li": WhoisChLi,
+    "id": WhoisID,
+    "sk": WhoisSK,
+    "se": WhoisSe,
+    "no": WhoisNo,
+    "nu": WhoisSe,
+    "is": WhoisIs,
+    "dk": WhoisDk,
+    "it": WhoisIt,
+    "mx": WhoisMx,
+    "ai": WhoisAi,
+    "il": WhoisIl,
+    "in": WhoisIn,
+    "cat": WhoisCat,
+    "ie": WhoisIe,
+    "nz": WhoisNz,
+    "space": WhoisSpace,
+    "lu": WhoisLu,
+    "cz": WhoisCz,
+    "online": WhoisOnline,
+    "cn": WhoisCn,
+    "app": WhoisApp,
+    "money": WhoisMoney,
+    "cl": WhoisCl,
+    "ar": WhoisAr,
+    "by": WhoisBy,
+    "cr": WhoisCr,
+    "do": WhoisDo,
+    "jobs": WhoisJobs,
+    "lat": WhoisLat,
+    "pe": WhoisPe,
+    "ro": WhoisRo,
+    "sa": WhoisSa,
+    "tw": WhoisTw,
+    "tr": WhoisTr,
+    "ve": WhoisVe,
+    "ua": WhoisUA,
+    "укр": WhoisUkr,
+    "xn--j1amh": WhoisUkr,
+    "kz": WhoisKZ,
+    "ir": WhoisIR,
+    "中国": WhoisZhongGuo,
+    "website": WhoisWebsite,
+    "sg": WhoisSG,
+    "ml": WhoisML,
+    "ooo": WhoisOoo,
+    "group": WhoisGroup,
+    "market": WhoisMarket,
+    "za": WhoisZa,
+    "bw": WhoisBw,
+    "bz": WhoisBz,
+    "gg": WhoisGg,
+    "city": WhoisCity,
+    "design": WhoisDesign,
+    "studio": WhoisStudio,
+    "style": WhoisStyle,
+    "рус": WhoisPyc,
+    "xn--p1acf": WhoisPyc,
+    "life": WhoisLife,
+    "tn": WhoisTN,
+    "rs": WhoisRs,
+    "site": WhoisSite,
+    "edu": WhoisEdu,
+    "lv": WhoisLv,
+}
@@ -27,16 +27,32 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import asyncio
+import atexit
+import functools
+import json
 import os
 import optparse
 import socket
 import sys
 import re
+import tempfile
 import logging
+import threading
+import time
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def idna_encode_label(label):
+    """IDNA encode a single domain label. Only used for TLDs, which are few
+    enough that every encoding can be memoized.
+    """
+    return label.encode("idna").decode("ascii")
+
+
 class NICClient(object):
     ABUSEHOST = "whois.abuse.net"
     AI_HOST = "whois.nic.ai"
@@ -114,11 +130,101 @@ class NICClient(object):
     SITE_HOST = "whois.nic.site"
     DESIGN_HOST = "whois.nic.design"
 
+    # initial lookup NIC host by TLD, in IDNA form
+    TLD_SERVERS = {
+        "ai": AI_HOST,
+        "app": APP_HOST,
+        "ar": AR_HOST,
+        "bw": BW_HOST,
+        "by": BY_HOST,
+        "ca": CA_HOST,
+        "chat": CHAT_HOST,
+        "cl": CL_HOST,
+        "cr": CR_HOST,
+        "de": DE_HOST,
+        "dev": DEV_HOST,
+        "dk": DK_HOST,
+        "do": DO_HOST,
+        "games": GAMES_HOST,
+        "goog": GOOGLE_HOST,
+        "google": GOOGLE_HOST,
+        "group": GROUP_HOST,
+        "hk": HK_HOST,
+        "hn": HN_HOST,
+        "ist": IST_HOST,
+        "jobs": JOBS_HOST,
+        "jp": JP_HOST,
+        "kz": KZ_HOST,
+        "lat": LAT_HOST,
+        "li": LI_HOST,
+        "live": LIVE_HOST,
+        "lt": LT_HOST,
+        "market": MARKET_HOST,
+        "money": MONEY_HOST,
+        "mx": MX_HOST,
+        "nl": NL_HOST,
+        "online": ONLINE_HOST,
+        "ooo": OOO_HOST,
+        "page": PAGE_HOST,
+        "pe": PE_HOST,
+        "website": WEBSITE_HOST,
+        "za": ZA_HOST,
+        "ru": RU_HOST,
+        "bz": RU_HOST,
+        "city": RU_HOST,
+        "design": DESIGN_HOST,
+        "studio": STUDIO_HOST,
+        "style": RU_HOST,
+        "su": RU_HOST,
+        "xn--p1acf": RU_HOST,  # .рус
+        "direct": IDS_HOST,
+        "immo": IDS_HOST,
+        "life": IDS_HOST,
+        "fashion": GDD_HOST,
+        "vip": GDD_HOST,
+        "shop": SHOP_HOST,
+        "store": STORE_HOST,
+        "xn--d1acj3b": DETI_HOST,  # .дети
+        "xn--80adxhks": MOSKVA_HOST,  # .москва
+        "xn--p1ai": RF_HOST,  # .рф
+        "xn--c1avg": PIR_HOST,  # .орг
+        "ng": NG_HOST,
+        "xn--j1amh": UKR_HOST,  # .укр
+        "tn": TN_HOST,
+        "sbs": SBS_HOST,
+        "sg": SG_HOST,
+        "site": SITE_HOST,
+    }
+
+    RECV_BUFSIZE = 65536
+
     WHOIS_RECURSE = 0x01
     WHOIS_QUICK = 0x02
 
     ip_whois = [LNICHOST, RNICHOST, PNICHOST, BNICHOST, PANDIHOST]
 
+    # servers found through IANA are remembered per TLD, in memory and on disk.
+    # Set SERVER_CACHE_PATH to None to keep the cache in memory only
+    SERVER_CACHE_PATH = os.path.join(
+        os.path.expanduser("~"), ".cache", "python-whois", "servers.json"
+    )
+    SERVER_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+    SERVER_CACHE_SIZE = 4096
+
+    # "no match" responses are remembered per query for a shorter time
+    NEGATIVE_CACHE_TTL = 24 * 60 * 60  # 1 day
+    NEGATIVE_CACHE_SIZE = 4096
+    NO_MATCH_REGEX = re.compile(
+        r"^\s*(?:no match for|no entries found|no data found|(?:domain )?not found)",
+        flags=re.IGNORECASE | re.MULTILINE,
+    )
+
+    _server_cache = None
+    _server_cache_dirty = False
+    _server_cache_lock = threading.Lock()
+    _negative_cache = OrderedDict()
+    _negative_cache_lock = threading.Lock()
+
     def __init__(self):
         self.use_qnichost = False
 
@@ -174,23 +280,194 @@ class NICClient(object):
             )
         else:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, NICClient.RECV_BUFSIZE)
         return s
 
+    @staticmethod
+    def recv_all(s):
+        """Read from socket ``s`` until the server closes the connection"""
+        response = bytearray()
+        while True:
+            d = s.recv(NICClient.RECV_BUFSIZE)
+            if not d:
+                break
+            response += d
+        return bytes(response)
 
     def findwhois_iana(self, tld):
         s = self.get_socket()
         s.settimeout(10)
-        s.connect(("whois.iana.org", 43))
+        s.connect((NICClient.IANAHOST, 43))
         s.send(bytes(tld, "utf-8") + b"\r\n")
-        response = b""
-        while True:
-            d = s.recv(4096)
-            response += d
-            if not d:
-                break
+        response = self.recv_all(s)
         s.close()
+        return NICClient.parse_iana_response(response)
+
+    async def findwhois_iana_async(self, tld, timeout=10):
+        """Asynchronous version of ``findwhois_iana``"""
+        if "SOCKS" in os.environ:
+            # asyncio cannot connect through the proxy, so use a thread instead
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.findwhois_iana, tld)
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(NICClient.IANAHOST, 43), timeout
+        )
+        try:
+            writer.write(bytes(tld, "utf-8") + b"\r\n")
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), timeout)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+        return NICClient.parse_iana_response(response)
+
+    @staticmethod
+    def parse_iana_response(response):
+        """Extract the whois server from a raw IANA TLD lookup response"""
         return re.search(r"whois:\s+(.*?)\n", response.decode("utf-8")).group(1)
 
+    @classmethod
+    def _load_server_cache(cls):
+        """Return the TLD to server cache, reading it from disk on first use.
+        Must be called with ``_server_cache_lock`` held.
+        """
+        if cls._server_cache is None:
+            cls._server_cache = OrderedDict()
+            saved = {}
+            if cls.SERVER_CACHE_PATH:
+                try:
+                    with open(cls.SERVER_CACHE_PATH, encoding="utf-8") as cache_fp:
+                        saved = json.load(cache_fp)
+                except (OSError, ValueError):
+                    pass  # missing or corrupt cache, start afresh
+            if not isinstance(saved, dict):
+                saved = {}  # not written by us, start afresh
+            expired = time.time() - cls.SERVER_CACHE_TTL
+            for tld, entry in saved.items():
+                # skip entries that were edited by hand or have an old format
+                if (
+                    isinstance(entry, dict)
+                    and isinstance(entry.get("server"), str)
+                    and isinstance(entry.get("ts"), (int, float))
+                    and entry["ts"] > expired
+                ):
+                    cls._server_cache[tld] = entry
+            while len(cls._server_cache) > cls.SERVER_CACHE_SIZE:
+                cls._server_cache.popitem(last=False)
+        return cls._server_cache
+
+    @classmethod
+    def _save_server_cache(cls):
+        """Write the TLD to server cache back to disk"""
+        with cls._server_cache_lock:
+            if not cls._server_cache_dirty or not cls.SERVER_CACHE_PATH:
+                return
+            cache_dir = os.path.dirname(cls.SERVER_CACHE_PATH)
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                # write a temporary file and swap it in, so that processes
+                # exiting together never leave a truncated cache behind
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as cache_fp:
+                        json.dump(cls._server_cache, cache_fp)
+                    os.replace(tmp_path, cls.SERVER_CACHE_PATH)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except OSError as exc:
+                logger.debug("Could not save whois server cache: {}".format(exc))
+            else:
+                cls._server_cache_dirty = False
+
+    @classmethod
+    def get_cached_server(cls, tld):
+        """Return the server cached for ``tld``, or None when it is unknown or
+        older than ``SERVER_CACHE_TTL`` seconds.
+        """
+        with cls._server_cache_lock:
+            cache = cls._load_server_cache()
+            entry = cache.get(tld)
+            if entry is not None and entry["ts"] > time.time() - cls.SERVER_CACHE_TTL:
+                cache.move_to_end(tld)
+                return entry["server"]
+        return None
+
+    @classmethod
+    def set_cached_server(cls, tld, server):
+        """Remember ``server`` for ``tld``, evicting the least recently used
+        entries beyond ``SERVER_CACHE_SIZE``.
+        """
+        with cls._server_cache_lock:
+            cache = cls._load_server_cache()
+            cache[tld] = {"server": server, "ts": time.time()}
+            cache.move_to_end(tld)
+            while len(cache) > cls.SERVER_CACHE_SIZE:
+                cache.popitem(last=False)
+            if not cls._server_cache_dirty:
+                cls._server_cache_dirty = True
+                atexit.register(cls._save_server_cache)
+
+    def findwhois_iana_cached(self, tld):
+        """Like ``findwhois_iana`` but reuses servers found within the last
+        ``SERVER_CACHE_TTL`` seconds.
+        """
+        server = self.get_cached_server(tld)
+        if server is None:
+            server = self.findwhois_iana(tld)
+            self.set_cached_server(tld, server)
+        return server
+
+    async def findwhois_iana_cached_async(self, tld):
+        """Asynchronous version of ``findwhois_iana_cached``"""
+        server = self.get_cached_server(tld)
+        if server is None:
+            server = await self.findwhois_iana_async(tld)
+            self.set_cached_server(tld, server)
+        return server
+
+    @classmethod
+    def get_negative_result(cls, query):
+        """Return the cached "no match" response for ``query`` if it was
+        received within the last ``NEGATIVE_CACHE_TTL`` seconds.
+        """
+        if isinstance(query, bytes):
+            query = query.decode("utf-8")
+        with cls._negative_cache_lock:
+            entry = cls._negative_cache.get(query)
+            if entry is not None:
+                expires, response = entry
+                if expires > time.time():
+                    return response
+                cls._negative_cache.pop(query, None)
+        return None
+
+    @classmethod
+    def set_negative_result(cls, query, response):
+        """Cache ``response`` for ``query`` if it says the domain is not
+        registered, evicting expired entries and the oldest ones beyond
+        ``NEGATIVE_CACHE_SIZE``.
+        """
+        if NICClient.NO_MATCH_REGEX.search(response):
+            if isinstance(query, bytes):
+                query = query.decode("utf-8")
+            now = time.time()
+            with cls._negative_cache_lock:
+                cache = cls._negative_cache
+                cache[query] = (now + cls.NEGATIVE_CACHE_TTL, response)
+                cache.move_to_end(query)
+                # entries share one TTL, so the oldest expire first
+                while cache and next(iter(cache.values()))[0] <= now:
+                    cache.popitem(last=False)
+                while len(cache) > cls.NEGATIVE_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+    @classmethod
+    def clear_negative_cache(cls):
+        """Forget all cached "no match" responses"""
+        with cls._negative_cache_lock:
+            cls._negative_cache.clear()
+
     def whois(self, query, hostname, flags, many_results=False, quiet=False, timeout=10):
         """Perform initial lookup with TLD whois server
         then, if the quick flag is false, search that result
@@ -224,22 +501,17 @@ class NICClient(object):
             else:
                 query_bytes = query
             s.send(bytes(query_bytes, "utf-8") + b"\r\n")
-            # recv returns bytes
-            while True:
-                d = s.recv(4096)
-                response += d
-                if not d:
-                    break
+            response = self.recv_all(s)
             s.close()
 
             nhost = None
             response = response.decode("utf-8", "replace")
             if 'with "=xxx"' in response:
-                return self.whois(query, hostname, flags, True)
+                return self.whois(query, hostname, flags, True, timeout=timeout)
             if flags & NICClient.WHOIS_RECURSE and nhost is None:
                 nhost = self.findwhois_server(response, hostname, query)
             if nhost is not None and nhost != "":
-                response += self.whois(query, nhost, 0, quiet=True)
+                response += self.whois(query, nhost, 0, quiet=True, timeout=timeout)
         except (
             socket.error
         ) as exc:  # 'response' is assigned a value (also a str) even on socket timeout
@@ -253,166 +525,67 @@ class NICClient(object):
 
     def choose_server(self, domain):
         """Choose initial lookup NIC host"""
-        try:
-            domain = domain.encode("idna").decode("utf-8")
-        except TypeError:
-            domain = domain.decode("utf-8").encode("idna").decode("utf-8")
-        except AttributeError:
-            domain = domain.decode("utf-8").encode("idna").decode("utf-8")
+        server, tld = self.choose_known_server(domain)
+        if server is None and tld:
+            server = self.findwhois_iana_cached(tld)
+        return server
+
+    async def choose_server_async(self, domain):
+        """Asynchronous version of ``choose_server``, so that IANA lookups for
+        several unknown TLDs can run concurrently, e.g. with
+        ``asyncio.gather(*(client.choose_server_async(d) for d in domains))``
+        """
+        server, tld = self.choose_known_server(domain)
+        if server is None and tld:
+            server = await self.findwhois_iana_cached_async(tld)
+        return server
+
+    def choose_known_server(self, domain):
+        """Choose initial lookup NIC host from the built in table.
+        Returns a ``(server, tld)`` tuple where ``server`` is None if the TLD
+        is not known and needs to be looked up with IANA.
+        """
+        if isinstance(domain, bytes):
+            domain = domain.decode("utf-8")
+        # only the end of the name is inspected, so only the TLD is IDNA encoded
+        head, dot, tld = domain.rpartition(".")
+        if not tld.isascii():
+            tld = idna_encode_label(tld)
+            domain = head + dot + tld
         if domain.endswith("-NORID"):
-            return NICClient.NORIDHOST
+            return NICClient.NORIDHOST, None
         if domain.endswith("id"):
-            return NICClient.PANDIHOST
+            return NICClient.PANDIHOST, None
         if domain.endswith("hr"):
-            return NICClient.HR_HOST
+            return NICClient.HR_HOST, None
         if domain.endswith(".pp.ua"):
-            return NICClient.PPUA_HOST
+            return NICClient.PPUA_HOST, None
 
-        domain = domain.split(".")
-        if len(domain) < 2:
-            return None
-        tld = domain[-1]
+        if not dot:
+            return None, None
         if tld[0].isdigit():
-            return NICClient.ANICHOST
-        elif tld == "ai":
-            return NICClient.AI_HOST
-        elif tld == "app":
-            return NICClient.APP_HOST
-        elif tld == "ar":
-            return NICClient.AR_HOST
-        elif tld == "bw":
-            return NICClient.BW_HOST
-        elif tld == "by":
-            return NICClient.BY_HOST
-        elif tld == "ca":
-            return NICClient.CA_HOST
-        elif tld == "chat":
-            return NICClient.CHAT_HOST
-        elif tld == "cl":
-            return NICClient.CL_HOST
-        elif tld == "cr":
-            return NICClient.CR_HOST
-        elif tld == "de":
-            return NICClient.DE_HOST
-        elif tld == "dev":
-            return NICClient.DEV_HOST
-        elif tld == "dk":
-            return NICClient.DK_HOST
-        elif tld == "do":
-            return NICClient.DO_HOST
-        elif tld == "games":
-            return NICClient.GAMES_HOST
-        elif tld == "goog" or tld == "google":
-            return NICClient.GOOGLE_HOST
-        elif tld == "group":
-            return NICClient.GROUP_HOST
-        elif tld == "hk":
-            return NICClient.HK_HOST
-        elif tld == "hn":
-            return NICClient.HN_HOST
-        elif tld == "ist":
-            return NICClient.IST_HOST
-        elif tld == "jobs":
-            return NICClient.JOBS_HOST
-        elif tld == "jp":
-            return NICClient.JP_HOST
-        elif tld == "kz":
-            return NICClient.KZ_HOST
-        elif tld == "lat":
-            return NICClient.LAT_HOST
-        elif tld == "li":
-            return NICClient.LI_HOST
-        elif tld == "live":
-            return NICClient.LIVE_HOST
-        elif tld == "lt":
-            return NICClient.LT_HOST
-        elif tld == "market":
-            return NICClient.MARKET_HOST
-        elif tld == "money":
-            return NICClient.MONEY_HOST
-        elif tld == "mx":
-            return NICClient.MX_HOST
-        elif tld == "nl":
-            return NICClient.NL_HOST
-        elif tld == "online":
-            return NICClient.ONLINE_HOST
-        elif tld == "ooo":
-            return NICClient.OOO_HOST
-        elif tld == "page":
-            return NICClient.PAGE_HOST
-        elif tld == "pe":
-            return NICClient.PE_HOST
-        elif tld == "website":
-            return NICClient.WEBSITE_HOST
-        elif tld == "za":
-            return NICClient.ZA_HOST
-        elif tld == "ru":
-            return NICClient.RU_HOST
-        elif tld == "bz":
-            return NICClient.RU_HOST
-        elif tld == "city":
-            return NICClient.RU_HOST
-        elif tld == "design":
-            return NICClient.DESIGN_HOST
-        elif tld == "studio":
-            return NICClient.STUDIO_HOST
-        elif tld == "style":
-            return NICClient.RU_HOST
-        elif tld == "su":
-            return NICClient.RU_HOST
-        elif tld == "рус" or tld == "xn--p1acf":
-            return NICClient.RU_HOST
-        elif tld == "direct":
-            return NICClient.IDS_HOST
-        elif tld == "group":
-            return NICClient.IDS_HOST
-        elif tld == "immo":
-            return NICClient.IDS_HOST
-        elif tld == "life":
-            return NICClient.IDS_HOST
-        elif tld == "fashion":
-            return NICClient.GDD_HOST
-        elif tld == "vip":
-            return NICClient.GDD_HOST
-        elif tld == "shop":
-            return NICClient.SHOP_HOST
-        elif tld == "store":
-            return NICClient.STORE_HOST
-        elif tld == "дети" or tld == "xn--d1acj3b":
-            return NICClient.DETI_HOST
-        elif tld == "москва" or tld == "xn--80adxhks":
-            return NICClient.MOSKVA_HOST
-        elif tld == "рф" or tld == "xn--p1ai":
-            return NICClient.RF_HOST
-        elif tld == "орг" or tld == "xn--c1avg":
-            return NICClient.PIR_HOST
-        elif tld == "ng":
-            return NICClient.NG_HOST
-        elif tld == "укр" or tld == "xn--j1amh":
-            return NICClient.UKR_HOST
-        elif tld == "tn":
-            return NICClient.TN_HOST
-        elif tld == "sbs":
-            return NICClient.SBS_HOST
-        elif tld == "sg":
-            return NICClient.SG_HOST
-        elif tld == "site":
-            return NICClient.SITE_HOST
-        else:
-            return self.findwhois_iana(tld)
-            # server = tld + NICClient.QNICHOST_TAIL
-            # try:
-            #    socket.gethostbyname(server)
-            # except socket.gaierror:
-            #    server = NICClient.QNICHOST_HEAD + tld
-            # return server
-
-    def whois_lookup(self, options, query_arg, flags, quiet=False):
+            return NICClient.ANICHOST, tld
+        return NICClient.TLD_SERVERS.get(tld), tld
+
+    def choose_servers(self, domains):
+        """Choose the initial lookup NIC host for each of ``domains`` and
+        return a dict mapping every domain to its host. Repeated domains
+        are only resolved once.
+        """
+        servers = {}
+        choose_server = self.choose_server
+        for domain in domains:
+            if domain not in servers:
+                servers[domain] = choose_server(domain)
+        return servers
+
+    def whois_lookup(self, options, query_arg, flags, quiet=False, timeout=10):
         """Main entry point: Perform initial lookup on TLD whois server,
         or other server to get region-specific whois server, then if quick
         flag is false, perform a second lookup on the region-specific
         server for contact records.  If `quiet` is `True`, no message
-        will be printed to STDOUT when a socket error is encountered."""
+        will be printed to STDOUT when a socket error is encountered.
+        `timeout` is the socket timeout in seconds for each whois query."""
         nichost = None
         # whoud happen when this function is called by other than main
         if options is None:
@@ -432,15 +605,23 @@ class NICClient(object):
                 options["country"] + NICClient.QNICHOST_TAIL,
                 flags,
                 quiet=quiet,
+                timeout=timeout,
             )
         elif self.use_qnichost:
-            nichost = self.choose_server(query_arg)
-            if nichost is not None:
-                result = self.whois(query_arg, nichost, flags, quiet=quiet)
-            else:
-                result = ""
+            result = self.get_negative_result(query_arg)
+            if result is None:
+                nichost = self.choose_server(query_arg)
+                if nichost is not None:
+                    result = self.whois(
+                        query_arg, nichost, flags, quiet=quiet, timeout=timeout
+                    )
+                    self.set_negative_result(query_arg, result)
+                else:
+                    result = ""
         else:
-            result = self.whois(query_arg, options["whoishost"], flags, quiet=quiet)
+            result = self.whois(
+                query_arg, options["whoishost"], flags, quiet=quiet, timeout=timeout
+            )
         return result
 
 